@@ -12,6 +12,7 @@ from decimal import Decimal
 import re
 import json
 import time
+import traceback
 from typing import List, Dict, Optional, Any, Union
 import logging
 from dataclasses import dataclass
@@ -232,7 +233,6 @@ class CalPolyParser(UniversityParser):
             
         except Exception as e:
             logger.error(f"Error parsing {major} degree page: {e}")
-            import traceback
             traceback.print_exc()
             return None
     
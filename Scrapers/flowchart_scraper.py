@@ -6,32 +6,54 @@ Supports multiple universities with easy configuration system
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from decimal import Decimal
 import re
+import string
 import json
 import time
-import io
-from typing import List, Dict, Optional, Any, Tuple
+import random
+import hashlib
+import functools
+import itertools
+import bisect
+import threading
+import contextlib
+import os
+import multiprocessing
+from collections import defaultdict, OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlparse
+from typing import List, Dict, Mapping, Optional, Any, Tuple, Callable
 import logging
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import sys
 
-# Try to import PDF processing libraries (optional for non-PDF sources)
+# PDF libraries are optional; their imports and text extraction live in pdf_text so
+# extraction worker processes do not have to import this module
+from pdf_text import PYMUPDF_SUPPORT, PDF_SUPPORT, PDFPLUMBER_SUPPORT, extract_pdf_text
+
+# orjson parses bytes directly and is much faster than the stdlib json module
 try:
-    import PyPDF2
-    PDF_SUPPORT = True
+    import orjson
+    ORJSON_SUPPORT = True
 except ImportError:
-    PDF_SUPPORT = False
-    
+    ORJSON_SUPPORT = False
+
+# requests-cache lets re-runs revalidate unchanged flowchart PDFs instead of re-downloading them
 try:
-    import pdfplumber
-    PDFPLUMBER_SUPPORT = True
+    import requests_cache
+    REQUESTS_CACHE_SUPPORT = True
 except ImportError:
-    PDFPLUMBER_SUPPORT = False
+    REQUESTS_CACHE_SUPPORT = False
 
 # Configure logging
 logging.basicConfig(
@@ -44,18 +66,69 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Download tuning: concurrent fetches per university and per-host token bucket (requests/s, burst)
+MAX_DOWNLOAD_WORKERS = 4
+MAX_UNIVERSITY_WORKERS = 8
+HOST_REQUEST_RATE = 0.5
+HOST_REQUEST_BURST = 2
+MAX_FLOWCHART_BYTES = 20 * 1024 * 1024
+
+# PDF text extraction is CPU-bound, so it runs in worker processes
+MAX_PARSE_WORKERS = os.cpu_count() or 1
+# Parsed text structures kept per parser (least recently used are evicted first)
+TEXT_CACHE_SIZE = 64
+
+# HTTP connection pool shared by all download threads; transient failures are retried by urllib3
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Response cache (requests-cache, when installed); flowcharts are fixed per catalog year.
+# Kept next to this script (flowchart_cache.sqlite) whatever the working directory.
+HTTP_CACHE_NAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'flowchart_cache')
+HTTP_CACHE_EXPIRE_SECONDS = 86400
+
+# DynamoDB writes: BatchWriteItem limit and exponential backoff while the table is throttling
+DYNAMODB_BATCH_SIZE = 25
+# One client is shared by the university threads. batch_writer is synchronous, so each thread has
+# at most one DynamoDB call in flight; +2 covers the table_status check in test_connections and
+# spare. With 8 threads this equals botocore's default of 10; it grows if MAX_UNIVERSITY_WORKERS does.
+DYNAMODB_MAX_POOL_CONNECTIONS = MAX_UNIVERSITY_WORKERS + 2
+# botocore retries each call itself (adaptive mode adds client-side rate limiting); the
+# batch-level retry below only kicks in once those attempts are exhausted
+DYNAMODB_CLIENT_MAX_ATTEMPTS = 10
+MAX_WRITE_ATTEMPTS = 4
+WRITE_BACKOFF_SECONDS = 0.5
+WRITE_BACKOFF_CAP_SECONDS = 8.0
+THROTTLING_ERROR_CODES = frozenset({
+    'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded'
+})
+
+# DynamoDB rejects floats, so non-integer numbers are built as Decimal where they are produced
+MINIMUM_GPA = Decimal('2.0')
+
+@dataclass(slots=True, frozen=True)
 class CourseFlowchart:
     """Universal data class for course flowchart information"""
     university: str
     major: str
     academic_year: str
     catalog_year: str
-    flowchart: Dict[str, Any]
+    flowchart: Mapping[str, Any]  # shared with parser caches/templates; do not mutate
     tracks: List[Dict[str, Any]]
     system: str  # "quarter", "semester", "trimester"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class FlowchartDigest:
+    """Everything the DynamoDB item needs from a flowchart, gathered in one walk"""
+    degree_plan: Dict[str, Any]
+    total_units: int
+    summary: Dict[str, Any]
+    required_courses: Dict[str, List[str]]  # category filter -> course ids
+    prerequisites: Dict[str, List[str]]
+    courses_by_level: Dict[str, List[str]]
+
+@dataclass(slots=True, frozen=True)
 class UniversityFlowchartConfig:
     """Configuration for university-specific flowchart scraping"""
     name: str
@@ -68,29 +141,311 @@ class UniversityFlowchartConfig:
     content_type: str  # "pdf", "html", "json"
     
     # Parsing patterns
-    year_patterns: List[Tuple[str, str]]  # (regex, year_key)
-    quarter_keywords: Dict[str, List[str]]  # quarter_name -> keywords
+    year_patterns: Tuple[Tuple[str, str], ...]  # (regex, year_key)
+    quarter_keywords: Dict[str, Tuple[str, ...]]  # quarter_name -> keywords
     course_pattern: str  # regex for course extraction
     units_pattern: str  # regex for units extraction
-    prerequisite_patterns: List[str]  # regex patterns for prerequisites
-    track_patterns: List[str]  # regex patterns for tracks/concentrations
+    prerequisite_patterns: Tuple[str, ...]  # regex patterns for prerequisites
+    track_patterns: Tuple[str, ...]  # regex patterns for tracks/concentrations
     
     # Course categorization
-    major_departments: List[str]
-    support_departments: List[str]
+    major_departments: Tuple[str, ...]
+    support_departments: Tuple[str, ...]
     
     # System-specific settings
     periods_per_year: int  # 3 for quarter, 2 for semester
-    period_names: List[str]  # ["Fall", "Winter", "Spring"] or ["Fall", "Spring"]
+    period_names: Tuple[str, ...]  # ("Fall", "Winter", "Spring") or ("Fall", "Spring")
+    
+    def __post_init__(self):
+        """Normalize list fields to tuples of interned strings so configs can share them"""
+        def intern_all(values):
+            return tuple(sys.intern(value) for value in values)
+        
+        # Frozen dataclass: fields have to be set through object.__setattr__
+        object.__setattr__(self, 'year_patterns', tuple(
+            (pattern, sys.intern(year_key)) for pattern, year_key in self.year_patterns
+        ))
+        object.__setattr__(self, 'quarter_keywords', {
+            sys.intern(period): intern_all(keywords) for period, keywords in self.quarter_keywords.items()
+        })
+        object.__setattr__(self, 'prerequisite_patterns', tuple(self.prerequisite_patterns))
+        object.__setattr__(self, 'track_patterns', tuple(self.track_patterns))
+        object.__setattr__(self, 'major_departments', intern_all(self.major_departments))
+        object.__setattr__(self, 'support_departments', intern_all(self.support_departments))
+        object.__setattr__(self, 'period_names', intern_all(self.period_names))
+
+# Fixed patterns, compiled once at import (config-specific patterns are compiled per parser)
+_CATALOG_YEAR_RE = re.compile(r'(\d{4})-(\d{2,4})')
+_PATTERN_CASE_RE = re.compile(r'(\\.)|[A-Z]+', re.DOTALL)
+_LEADING_WORD_RE = re.compile(r'[A-Za-z]+')
+
+# Maps only A-Z, so the lowered text keeps the original's offsets even for non-ASCII input
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def _ascii_lower(text: str) -> str:
+    """Lower-case ASCII letters without changing the length of the string"""
+    return text.lower() if text.isascii() else text.translate(_ASCII_LOWER)
+
+def _lower_pattern(pattern: str) -> str:
+    """Lower-case a regex's letters, leaving escapes such as \\S or \\W untouched"""
+    return _PATTERN_CASE_RE.sub(lambda m: m.group(1) or m.group(0).lower(), pattern)
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the literal word a regex must start with, or '' if there is none"""
+    if '|' in pattern:
+        return ''
+    prefix_match = _LEADING_WORD_RE.match(pattern)
+    if not prefix_match:
+        return ''
+    prefix = prefix_match.group(0)
+    # A quantifier after the prefix makes its last character optional
+    if pattern[len(prefix):len(prefix) + 1] in ('?', '*', '{'):
+        prefix = prefix[:-1]
+    return prefix
+
+def _find_first(text: str, keywords: Tuple[str, ...]) -> Optional[Tuple[int, int]]:
+    """(start, end) of the first keyword, in priority order, found anywhere in text"""
+    for keyword in keywords:
+        start = text.find(keyword)
+        if start != -1:
+            return start, start + len(keyword)
+    return None
+
+def _is_heading(text: str, start: int, end: int) -> bool:
+    """True when text[start:end] is a whole word longer than one letter (e.g. FALL, not the S in CSC)"""
+    return (end - start > 1
+            and (start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum()))
+
+# Look-ahead used for a period whose heading was only found through a one-letter fallback keyword
+_FALLBACK_PERIOD_WINDOW = 500
+
+def _template_course(course_id: str, course_name: str, units: int, category: str,
+                     prerequisites: Tuple[str, ...] = (), **details: Any) -> Dict[str, Any]:
+    """Build one course entry of a hard-coded flowchart template"""
+    course = {
+        'course_id': sys.intern(course_id),
+        'course_name': sys.intern(course_name),
+        'units': units,
+        'category': sys.intern(category),
+        'prerequisites': list(prerequisites)
+    }
+    for key, value in details.items():
+        course[key] = list(value) if isinstance(value, tuple) else value
+    return course
+
+def _build_template(periods) -> Dict[str, Any]:
+    """Nest (year_key, period_key, label, total_units, courses) rows into a flowchart dict"""
+    flowchart = {}
+    for year_key, period_key, label, total_units, courses in periods:
+        flowchart.setdefault(year_key, {})[period_key] = {
+            'period': label,
+            'total_units': total_units,
+            'courses': list(courses)
+        }
+    return flowchart
+
+# Cal Poly Computer Science plan used when a CS flowchart yields no courses.
+# Built once at import; treat it as read-only.
+_CALPOLY_CS_TEMPLATE = _build_template((
+    ('year_1', 'fall', 'Fall Freshman', 16, (
+        _template_course('CSC 101', 'Fundamentals of Computer Science', 4, 'major', (),
+                         description='Basic principles of algorithmic problem solving'),
+        _template_course('MATH 141', 'Calculus I', 4, 'support', (),
+                         description='Differential calculus of functions of one variable'),
+        _template_course('ENGL 134', 'Writing and Rhetoric', 4, 'ge', (), ge_area='A1'),
+        _template_course('GE Area B4', 'Mathematics/Science', 4, 'ge', (),
+                         ge_area='B4', options=('BIO 111', 'CHEM 124', 'GEOL 201')),
+    )),
+    ('year_1', 'winter', 'Winter Freshman', 16, (
+        _template_course('CSC 102', 'Fundamentals of Computer Science II', 4, 'major', ('CSC 101',),
+                         description='Object-oriented programming and data structures'),
+        _template_course('MATH 142', 'Calculus II', 4, 'support', ('MATH 141',),
+                         description='Integral calculus and infinite series'),
+        _template_course('PHYS 141', 'General Physics I', 4, 'support', ('MATH 141',),
+                         description='Classical mechanics'),
+        _template_course('GE Area C1', 'Literature', 4, 'ge', (), ge_area='C1'),
+    )),
+    ('year_1', 'spring', 'Spring Freshman', 16, (
+        _template_course('CSC 103', 'Fundamentals of Computer Science III', 4, 'major', ('CSC 102',),
+                         description='Advanced data structures and algorithms'),
+        _template_course('MATH 143', 'Calculus III', 4, 'support', ('MATH 142',), description='Multivariable calculus'),
+        _template_course('PHYS 142', 'General Physics II', 4, 'support', ('PHYS 141',),
+                         description='Electricity and magnetism'),
+        _template_course('GE Area D1', 'American Government', 4, 'ge', (), ge_area='D1'),
+    )),
+    ('year_2', 'fall', 'Fall Sophomore', 16, (
+        _template_course('CSC 225', 'Computer Organization', 4, 'major', ('CSC 103',),
+                         description='Computer architecture and assembly language'),
+        _template_course('CSC 202', 'Data Structures', 4, 'major', ('CSC 103',),
+                         description='Implementation of abstract data types'),
+        _template_course('MATH 244', 'Linear Analysis I', 4, 'support', ('MATH 143',),
+                         description='Linear algebra and matrix theory'),
+        _template_course('STAT 312', 'Statistical Methods', 4, 'support', ('MATH 142',),
+                         description='Applied probability and statistics'),
+    )),
+    ('year_2', 'winter', 'Winter Sophomore', 16, (
+        _template_course('CSC 357', 'Systems Programming', 4, 'major', ('CSC 225',),
+                         description='System calls, processes, and memory management'),
+        _template_course('CSC 203', 'Project-Based Object-Oriented Programming', 4, 'major', ('CSC 202',),
+                         description='Large-scale software development'),
+        _template_course('MATH 206', 'Linear Algebra', 4, 'support', ('MATH 244',),
+                         description='Vector spaces and linear transformations'),
+        _template_course('GE Area C3', 'Philosophy', 4, 'ge', (), ge_area='C3'),
+    )),
+    ('year_2', 'spring', 'Spring Sophomore', 16, (
+        _template_course('CSC 349', 'Design and Analysis of Algorithms', 4, 'major', ('CSC 202', 'MATH 244'),
+                         description='Algorithm design techniques and complexity analysis'),
+        _template_course('CPE 123', 'Digital Design', 4, 'major', ('CSC 225',),
+                         description='Digital logic and computer hardware'),
+        _template_course('PHYS 143', 'General Physics III', 4, 'support', ('PHYS 142',),
+                         description='Modern physics and quantum mechanics'),
+        _template_course('GE Area D2', 'Comparative Government', 4, 'ge', (), ge_area='D2'),
+    )),
+    ('year_3', 'fall', 'Fall Junior', 16, (
+        _template_course('CSC 430', 'Programming Languages', 4, 'major', ('CSC 349',),
+                         description='Principles of programming language design'),
+        _template_course('CSC 466', 'Knowledge Discovery from Data', 4, 'major', ('CSC 349', 'STAT 312'),
+                         description='Data mining and machine learning'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major', (),
+                         options=('CSC 402', 'CSC 405', 'CSC 409', 'CSC 448')),
+        _template_course('GE Area E', 'Lifelong Learning', 4, 'ge', (), ge_area='E'),
+    )),
+    ('year_3', 'winter', 'Winter Junior', 16, (
+        _template_course('CSC 431', 'Programming Languages II', 4, 'major', ('CSC 430',),
+                         description='Advanced programming language concepts'),
+        _template_course('CSC 307', 'Introduction to Software Engineering', 4, 'major', ('CSC 203',),
+                         description='Software development life cycle'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major', (),
+                         options=('CSC 453', 'CSC 454', 'CSC 458')),
+        _template_course('Free Elective', 'Free Elective', 4, 'elective'),
+    )),
+    ('year_3', 'spring', 'Spring Junior', 16, (
+        _template_course('CSC 308', 'Software Engineering', 4, 'major', ('CSC 307',),
+                         description='Advanced software engineering practices'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major', (),
+                         options=('CSC 484', 'CSC 489', 'CSC 491')),
+        _template_course('Technical Elective', 'Technical Elective', 4, 'elective'),
+        _template_course('GE Area F', 'Ethnic Studies', 4, 'ge', (), ge_area='F'),
+    )),
+    ('year_4', 'fall', 'Fall Senior', 15, (
+        _template_course('CSC 491', 'Senior Project I', 1, 'major', ('90+ units',),
+                         description='Senior capstone project initiation'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major'),
+        _template_course('Free Elective', 'Free Elective', 3, 'elective'),
+        _template_course('Free Elective', 'Free Elective', 3, 'elective'),
+    )),
+    ('year_4', 'winter', 'Winter Senior', 15, (
+        _template_course('CSC 492', 'Senior Project II', 2, 'major', ('CSC 491',),
+                         description='Senior capstone project development'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major'),
+        _template_course('Technical Elective', 'Technical Elective', 4, 'elective'),
+        _template_course('Free Elective', 'Free Elective', 3, 'elective'),
+        _template_course('Free Elective', 'Free Elective', 2, 'elective'),
+    )),
+    ('year_4', 'spring', 'Spring Senior', 15, (
+        _template_course('CSC 493', 'Senior Project III', 2, 'major', ('CSC 492',),
+                         description='Senior capstone project completion'),
+        _template_course('CSC Elective', 'CSC 400+ Elective', 4, 'major'),
+        _template_course('Technical Elective', 'Technical Elective', 4, 'elective'),
+        _template_course('Free Elective', 'Free Elective', 3, 'elective'),
+        _template_course('Free Elective', 'Free Elective', 2, 'elective'),
+    )),
+))
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+_pdf_pool_disabled = MAX_PARSE_WORKERS < 2
+
+def _get_pdf_pool() -> Optional[ProcessPoolExecutor]:
+    """Start the shared PDF worker pool on first use; None when processes are unavailable"""
+    global _pdf_pool, _pdf_pool_disabled
+    with _pdf_pool_lock:
+        if _pdf_pool is None and not _pdf_pool_disabled:
+            # spawn: the pool is started from download threads, where forking is unsafe. A spawned
+            # worker re-runs the launching script as __mp_main__ before its first task, so workers
+            # are kept for the whole run rather than recycled.
+            try:
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=MAX_PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            except (OSError, NotImplementedError) as e:
+                # e.g. AWS Lambda has no /dev/shm for multiprocessing queues
+                logger.warning(f"⚠️ PDF worker processes unavailable, parsing in-process: {e}")
+                _pdf_pool_disabled = True
+        return _pdf_pool
+
+def _pdf_text(content: bytes) -> str:
+    """Extract PDF text in a worker process, falling back to this process"""
+    global _pdf_pool, _pdf_pool_disabled
+    pool = _get_pdf_pool()
+    if pool is not None:
+        try:
+            return pool.submit(extract_pdf_text, content).result()
+        except BrokenProcessPool as e:
+            logger.warning(f"⚠️ PDF worker pool broke, parsing in-process: {e}")
+            with _pdf_pool_lock:
+                _pdf_pool_disabled = True
+            shutdown_pdf_pool()
+    return extract_pdf_text(content)
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF worker processes, if any were started"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+# Leading course-number digits (000-299) that count as foundational outside the major/support departments
+_FOUNDATIONAL_LEVELS = frozenset('012')
 
 class UniversalFlowchartParser:
     """Universal parser that adapts to different university configurations"""
     
     def __init__(self, config: UniversityFlowchartConfig):
         self.config = config
+        self._period_lc = tuple(sys.intern(period.lower()) for period in config.period_names)
+        self._compile_patterns()
+        # dept -> category dispatch table; major departments win if a dept is listed in both
+        self._dept_categories = {dept: 'support' for dept in config.support_departments}
+        self._dept_categories.update((dept, 'major') for dept in config.major_departments)
+        # (dept, number) -> shared "DEPT NUM" string; the same course recurs across years and texts
+        self._id_cache: Dict[Tuple[str, str], str] = {}
+        # text digest -> (catalog_year, flowchart, tracks) so shared curriculum PDFs are parsed once;
+        # bounded LRU, locked because download threads parse concurrently
+        self._text_cache: 'OrderedDict[bytes, Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]' = OrderedDict()
+        self._text_cache_lock = threading.Lock()
+        # major -> fallback template flowchart; built once per major and treated as read-only
+        self._template_cache: Dict[str, Dict[str, Any]] = {}
     
-    def get_university_info(self) -> Dict[str, str]:
-        """Return university metadata"""
+    def _compile_patterns(self) -> None:
+        """Compile the config's regex patterns once instead of on every search"""
+        config = self.config
+        self._course_re = re.compile(config.course_pattern)
+        self._units_re = re.compile(config.units_pattern)
+        # Heading patterns run lower-cased against lower-cased text instead of using re.IGNORECASE;
+        # course_pattern stays case-sensitive on the original text.
+        # All year patterns fused into one alternation; group y<i> maps back to year_patterns[i]
+        self._year_keys = [year_key for _, year_key in config.year_patterns]
+        self._year_union_re = re.compile(
+            '|'.join(f'(?P<y{i}>{_lower_pattern(pattern)})' for i, (pattern, _) in enumerate(config.year_patterns))
+        )
+        self._track_res = [re.compile(_lower_pattern(pattern)) for pattern in config.track_patterns]
+        # Literal heading each track pattern starts with; None when some pattern has no usable prefix
+        anchors = [_ascii_lower(_literal_prefix(pattern)) for pattern in config.track_patterns]
+        self._track_anchors = tuple(anchors) if all(anchors) else None
+        # Period keywords are plain literals, searched with str.find in priority order
+        self._period_keywords = tuple(
+            tuple(_ascii_lower(keyword) for keyword in config.quarter_keywords.get(period.lower(), [period]))
+            for period in config.period_names
+        )
+    
+    @functools.cached_property
+    def university_info(self) -> Dict[str, str]:
+        """University metadata, built once per parser (the config is frozen)"""
         return {
             "name": self.config.name,
             "short_name": self.config.short_name,
@@ -99,6 +454,10 @@ class UniversalFlowchartParser:
             "website": self.config.website
         }
     
+    def get_university_info(self) -> Dict[str, str]:
+        """Return university metadata"""
+        return self.university_info
+    
     def get_flowchart_urls(self) -> Dict[str, str]:
         """Return flowchart URLs for this university"""
         return self.config.flowchart_urls
@@ -122,18 +481,17 @@ class UniversalFlowchartParser:
     
     def _parse_pdf_flowchart(self, content: bytes, major: str) -> Optional[CourseFlowchart]:
         """Parse PDF flowchart using available libraries"""
+        if not (PYMUPDF_SUPPORT or PDFPLUMBER_SUPPORT or PDF_SUPPORT):
+            logger.warning("No PDF parsing library available. Creating template structure.")
+            return self._create_template_flowchart(major)
+        
         try:
-            if PDFPLUMBER_SUPPORT:
-                return self._parse_with_pdfplumber(content, major)
-            elif PDF_SUPPORT:
-                return self._parse_with_pypdf2(content, major)
-            else:
-                logger.warning("No PDF parsing library available. Creating template structure.")
-                return self._create_template_flowchart(major)
-                
+            text = _pdf_text(content)
         except Exception as e:
-            logger.error(f"PDF parsing failed: {e}")
-            return self._create_template_flowchart(major)
+            logger.error(f"PDF text extraction failed: {e}")
+            return None
+        
+        return self._parse_flowchart_text(text, major)
     
     def _parse_html_flowchart(self, content: bytes, major: str) -> Optional[CourseFlowchart]:
         """Parse HTML flowchart"""
@@ -148,66 +506,27 @@ class UniversalFlowchartParser:
     def _parse_json_flowchart(self, content: bytes, major: str) -> Optional[CourseFlowchart]:
         """Parse JSON flowchart"""
         try:
-            data = json.loads(content.decode('utf-8'))
+            if ORJSON_SUPPORT:
+                data = orjson.loads(content)
+            else:
+                data = json.loads(content.decode('utf-8'))
             return self._convert_json_to_flowchart(data, major)
         except Exception as e:
             logger.error(f"JSON parsing failed: {e}")
             return self._create_template_flowchart(major)
     
-    def _parse_with_pdfplumber(self, content: bytes, major: str) -> Optional[CourseFlowchart]:
-        """Parse PDF using pdfplumber (more accurate)"""
-        try:
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                
-                return self._parse_flowchart_text(text, major)
-                
-        except Exception as e:
-            logger.error(f"pdfplumber parsing failed: {e}")
-            return None
-    
-    def _parse_with_pypdf2(self, content: bytes, major: str) -> Optional[CourseFlowchart]:
-        """Parse PDF using PyPDF2 (fallback)"""
-        try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            text = ""
-            
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n"
-            
-            return self._parse_flowchart_text(text, major)
-            
-        except Exception as e:
-            logger.error(f"PyPDF2 parsing failed: {e}")
-            return None
-    
     def _parse_flowchart_text(self, text: str, major: str) -> Optional[CourseFlowchart]:
         """Parse flowchart from extracted text using university config"""
         try:
-            # Extract year information
-            year_pattern = r'(\d{4})-(\d{2,4})'
-            year_match = re.search(year_pattern, text)
-            catalog_year = year_match.group(0) if year_match else "2022-2026"
-            
-            # Debug: log some of the extracted text
-            logger.info(f"Extracted text sample: {text[:500]}...")
-            
-            # Create flowchart structure
-            flowchart = self._extract_year_structure(text)
+            # Reuse the regex pass when the same text was already parsed (e.g. shared PDFs)
+            key = hashlib.blake2s(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            catalog_year, flowchart, tracks = self._cached_text_structure(key, text)
             
             # If no courses found, create enhanced template with real course data
             if self._is_empty_flowchart(flowchart):
                 logger.info("No courses extracted from PDF, creating enhanced template")
                 flowchart = self._create_enhanced_template(major)
             
-            # Extract tracks/concentrations
-            tracks = self._extract_tracks(text)
-            
             return CourseFlowchart(
                 university=self.config.name,
                 major=major,
@@ -222,510 +541,75 @@ class UniversalFlowchartParser:
             logger.error(f"Error parsing flowchart text: {e}")
             return None
     
+    def _cached_text_structure(self, key: bytes, text: str) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+        """Return the text structure for key from the LRU cache, extracting it on a miss"""
+        cache = self._text_cache
+        with self._text_cache_lock:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+        
+        # Extract outside the lock so other threads' parses are not serialized behind this one
+        structure = self._extract_text_structure(text)
+        with self._text_cache_lock:
+            cached = cache.setdefault(key, structure)
+            cache.move_to_end(key)
+            while len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return cached
+    
+    def _extract_text_structure(self, text: str) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+        """Extract catalog year, year structure and tracks; independent of the major"""
+        # Extract year information
+        year_match = _CATALOG_YEAR_RE.search(text)
+        catalog_year = year_match.group(0) if year_match else "2022-2026"
+        
+        # Debug: log some of the extracted text (only slice/format when DEBUG is on)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted text sample: %s...", text[:500])
+        
+        # Lower-case once; heading searches run on this, captured values are sliced from text
+        text_lc = _ascii_lower(text)
+        
+        # Create flowchart structure
+        flowchart = self._extract_year_structure(text, text_lc)
+        
+        # Extract tracks/concentrations
+        tracks = self._extract_tracks(text, text_lc)
+        
+        return catalog_year, flowchart, tracks
+    
     def _is_empty_flowchart(self, flowchart: Dict[str, Any]) -> bool:
         """Check if flowchart has any actual course data"""
-        for year_data in flowchart.values():
-            if isinstance(year_data, dict):
-                for period_data in year_data.values():
-                    if isinstance(period_data, dict):
-                        courses = period_data.get('courses', [])
-                        if courses:
-                            return False
-        return True
+        dict_get = dict.get
+        return not any(
+            dict_get(period_data, 'courses')
+            for year_data in flowchart.values() if type(year_data) is dict
+            for period_data in year_data.values() if type(period_data) is dict
+        )
     
     def _create_enhanced_template(self, major: str) -> Dict[str, Any]:
         """Create enhanced template with realistic Cal Poly CS course data"""
         if major == "Computer Science":
-            return {
-                'year_1': {
-                    'fall': {
-                        'period': 'Fall Freshman',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 101',
-                                'course_name': 'Fundamentals of Computer Science',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': [],
-                                'description': 'Basic principles of algorithmic problem solving'
-                            },
-                            {
-                                'course_id': 'MATH 141',
-                                'course_name': 'Calculus I',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': [],
-                                'description': 'Differential calculus of functions of one variable'
-                            },
-                            {
-                                'course_id': 'ENGL 134',
-                                'course_name': 'Writing and Rhetoric',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'A1'
-                            },
-                            {
-                                'course_id': 'GE Area B4',
-                                'course_name': 'Mathematics/Science',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'B4',
-                                'options': ['BIO 111', 'CHEM 124', 'GEOL 201']
-                            }
-                        ]
-                    },
-                    'winter': {
-                        'period': 'Winter Freshman',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 102',
-                                'course_name': 'Fundamentals of Computer Science II',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 101'],
-                                'description': 'Object-oriented programming and data structures'
-                            },
-                            {
-                                'course_id': 'MATH 142',
-                                'course_name': 'Calculus II',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['MATH 141'],
-                                'description': 'Integral calculus and infinite series'
-                            },
-                            {
-                                'course_id': 'PHYS 141',
-                                'course_name': 'General Physics I',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['MATH 141'],
-                                'description': 'Classical mechanics'
-                            },
-                            {
-                                'course_id': 'GE Area C1',
-                                'course_name': 'Literature',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'C1'
-                            }
-                        ]
-                    },
-                    'spring': {
-                        'period': 'Spring Freshman',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 103',
-                                'course_name': 'Fundamentals of Computer Science III',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 102'],
-                                'description': 'Advanced data structures and algorithms'
-                            },
-                            {
-                                'course_id': 'MATH 143',
-                                'course_name': 'Calculus III',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['MATH 142'],
-                                'description': 'Multivariable calculus'
-                            },
-                            {
-                                'course_id': 'PHYS 142',
-                                'course_name': 'General Physics II',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['PHYS 141'],
-                                'description': 'Electricity and magnetism'
-                            },
-                            {
-                                'course_id': 'GE Area D1',
-                                'course_name': 'American Government',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'D1'
-                            }
-                        ]
-                    }
-                },
-                'year_2': {
-                    'fall': {
-                        'period': 'Fall Sophomore',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 225',
-                                'course_name': 'Computer Organization',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 103'],
-                                'description': 'Computer architecture and assembly language'
-                            },
-                            {
-                                'course_id': 'CSC 202',
-                                'course_name': 'Data Structures',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 103'],
-                                'description': 'Implementation of abstract data types'
-                            },
-                            {
-                                'course_id': 'MATH 244',
-                                'course_name': 'Linear Analysis I',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['MATH 143'],
-                                'description': 'Linear algebra and matrix theory'
-                            },
-                            {
-                                'course_id': 'STAT 312',
-                                'course_name': 'Statistical Methods',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['MATH 142'],
-                                'description': 'Applied probability and statistics'
-                            }
-                        ]
-                    },
-                    'winter': {
-                        'period': 'Winter Sophomore',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 357',
-                                'course_name': 'Systems Programming',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 225'],
-                                'description': 'System calls, processes, and memory management'
-                            },
-                            {
-                                'course_id': 'CSC 203',
-                                'course_name': 'Project-Based Object-Oriented Programming',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 202'],
-                                'description': 'Large-scale software development'
-                            },
-                            {
-                                'course_id': 'MATH 206',
-                                'course_name': 'Linear Algebra',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['MATH 244'],
-                                'description': 'Vector spaces and linear transformations'
-                            },
-                            {
-                                'course_id': 'GE Area C3',
-                                'course_name': 'Philosophy',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'C3'
-                            }
-                        ]
-                    },
-                    'spring': {
-                        'period': 'Spring Sophomore',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 349',
-                                'course_name': 'Design and Analysis of Algorithms',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 202', 'MATH 244'],
-                                'description': 'Algorithm design techniques and complexity analysis'
-                            },
-                            {
-                                'course_id': 'CPE 123',
-                                'course_name': 'Digital Design',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 225'],
-                                'description': 'Digital logic and computer hardware'
-                            },
-                            {
-                                'course_id': 'PHYS 143',
-                                'course_name': 'General Physics III',
-                                'units': 4,
-                                'category': 'support',
-                                'prerequisites': ['PHYS 142'],
-                                'description': 'Modern physics and quantum mechanics'
-                            },
-                            {
-                                'course_id': 'GE Area D2',
-                                'course_name': 'Comparative Government',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'D2'
-                            }
-                        ]
-                    }
-                },
-                'year_3': {
-                    'fall': {
-                        'period': 'Fall Junior',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 430',
-                                'course_name': 'Programming Languages',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 349'],
-                                'description': 'Principles of programming language design'
-                            },
-                            {
-                                'course_id': 'CSC 466',
-                                'course_name': 'Knowledge Discovery from Data',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 349', 'STAT 312'],
-                                'description': 'Data mining and machine learning'
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': [],
-                                'options': ['CSC 402', 'CSC 405', 'CSC 409', 'CSC 448']
-                            },
-                            {
-                                'course_id': 'GE Area E',
-                                'course_name': 'Lifelong Learning',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'E'
-                            }
-                        ]
-                    },
-                    'winter': {
-                        'period': 'Winter Junior',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 431',
-                                'course_name': 'Programming Languages II',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 430'],
-                                'description': 'Advanced programming language concepts'
-                            },
-                            {
-                                'course_id': 'CSC 307',
-                                'course_name': 'Introduction to Software Engineering',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 203'],
-                                'description': 'Software development life cycle'
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': [],
-                                'options': ['CSC 453', 'CSC 454', 'CSC 458']
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 4,
-                                'category': 'elective',
-                                'prerequisites': []
-                            }
-                        ]
-                    },
-                    'spring': {
-                        'period': 'Spring Junior',
-                        'total_units': 16,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 308',
-                                'course_name': 'Software Engineering',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': ['CSC 307'],
-                                'description': 'Advanced software engineering practices'
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': [],
-                                'options': ['CSC 484', 'CSC 489', 'CSC 491']
-                            },
-                            {
-                                'course_id': 'Technical Elective',
-                                'course_name': 'Technical Elective',
-                                'units': 4,
-                                'category': 'elective',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'GE Area F',
-                                'course_name': 'Ethnic Studies',
-                                'units': 4,
-                                'category': 'ge',
-                                'prerequisites': [],
-                                'ge_area': 'F'
-                            }
-                        ]
-                    }
-                },
-                'year_4': {
-                    'fall': {
-                        'period': 'Fall Senior',
-                        'total_units': 15,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 491',
-                                'course_name': 'Senior Project I',
-                                'units': 1,
-                                'category': 'major',
-                                'prerequisites': ['90+ units'],
-                                'description': 'Senior capstone project initiation'
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 3,
-                                'category': 'elective',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 3,
-                                'category': 'elective',
-                                'prerequisites': []
-                            }
-                        ]
-                    },
-                    'winter': {
-                        'period': 'Winter Senior',
-                        'total_units': 15,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 492',
-                                'course_name': 'Senior Project II',
-                                'units': 2,
-                                'category': 'major',
-                                'prerequisites': ['CSC 491'],
-                                'description': 'Senior capstone project development'
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Technical Elective',
-                                'course_name': 'Technical Elective',
-                                'units': 4,
-                                'category': 'elective',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 3,
-                                'category': 'elective',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 2,
-                                'category': 'elective',
-                                'prerequisites': []
-                            }
-                        ]
-                    },
-                    'spring': {
-                        'period': 'Spring Senior',
-                        'total_units': 15,
-                        'courses': [
-                            {
-                                'course_id': 'CSC 493',
-                                'course_name': 'Senior Project III',
-                                'units': 2,
-                                'category': 'major',
-                                'prerequisites': ['CSC 492'],
-                                'description': 'Senior capstone project completion'
-                            },
-                            {
-                                'course_id': 'CSC Elective',
-                                'course_name': 'CSC 400+ Elective',
-                                'units': 4,
-                                'category': 'major',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Technical Elective',
-                                'course_name': 'Technical Elective',
-                                'units': 4,
-                                'category': 'elective',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 3,
-                                'category': 'elective',
-                                'prerequisites': []
-                            },
-                            {
-                                'course_id': 'Free Elective',
-                                'course_name': 'Free Elective',
-                                'units': 2,
-                                'category': 'elective',
-                                'prerequisites': []
-                            }
-                        ]
-                    }
-                }
-            }
+            # Shallow copy; the year/period data is shared with the module-level template
+            return dict(_CALPOLY_CS_TEMPLATE)
         else:
             # Generic template for other majors
             return self._create_basic_structure("")
     
-    def _extract_tracks(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_tracks(self, text: str, text_lc: str) -> List[Dict[str, Any]]:
         """Extract track information using university config with better cleaning"""
         tracks = []
+        track_res = self._track_res if self._may_contain_tracks(text_lc) else []
         
         # Clean up track patterns to avoid extracting random text fragments
-        for pattern in self.config.track_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                track_name = match if isinstance(match, str) else match[0]
+        for track_re in track_res:
+            # Match on the lower-cased text, keep the original casing for the name
+            group = 1 if track_re.groups else 0
+            for match in track_re.finditer(text_lc):
+                start, end = match.span(group)
+                track_name = text[start:end]
                 
                 # Filter out obviously bad track names
                 if (len(track_name) > 10 and 
@@ -761,16 +645,36 @@ class UniversalFlowchartParser:
         
         return tracks
     
-    def _extract_year_structure(self, text: str) -> Dict[str, Any]:
+    def _may_contain_tracks(self, text_lc: str) -> bool:
+        """Cheap substring prefilter before running the track regexes over the whole text"""
+        if self._track_anchors is None:
+            return True
+        return any(anchor in text_lc for anchor in self._track_anchors)
+    
+    def _extract_year_structure(self, text: str, text_lc: str) -> Dict[str, Any]:
         """Extract year-by-year course structure using university config"""
         flowchart = {}
         
-        # Use university-specific year patterns
-        for pattern, year_key in self.config.year_patterns:
-            year_match = re.search(pattern, text, re.IGNORECASE)
-            if year_match:
-                year_courses = self._extract_year_courses(text, year_match.start(), year_key)
-                flowchart[year_key] = year_courses
+        # Single pass over the text for every year pattern at once
+        year_keys = self._year_keys
+        hits = [(year_keys[int(m.lastgroup[1:])], m.start()) for m in self._year_union_re.finditer(text_lc)]
+        hit_starts = [start for _, start in hits]
+        first_starts = {}
+        for year_key, start in hits:
+            first_starts.setdefault(year_key, start)
+        
+        for year_key in year_keys:
+            start_pos = first_starts.get(year_key)
+            if start_pos is None:
+                continue
+            # Year section ends where another year's heading appears (skipping the heading itself)
+            i = bisect.bisect_left(hit_starts, start_pos + 100)
+            while i < len(hits) and hits[i][0] == year_key:
+                i += 1
+            end_pos = hit_starts[i] if i < len(hits) else len(text)
+            flowchart[year_key] = self._extract_year_courses(
+                text[start_pos:end_pos], text_lc[start_pos:end_pos]
+            )
         
         # If no clear year structure found, create a basic one
         if not flowchart:
@@ -778,62 +682,53 @@ class UniversalFlowchartParser:
         
         return flowchart
     
-    def _extract_year_courses(self, text: str, start_pos: int, current_year: str) -> Dict[str, Any]:
-        """Extract courses for a specific year using university config"""
-        # Find end position (start of next year section)
-        end_pos = len(text)
-        for pattern, year_key in self.config.year_patterns:
-            if year_key != current_year:
-                next_match = re.search(pattern, text[start_pos + 100:], re.IGNORECASE)
-                if next_match:
-                    end_pos = min(end_pos, start_pos + 100 + next_match.start())
-        
-        year_text = text[start_pos:end_pos]
+    def _extract_year_courses(self, year_text: str, year_text_lc: str) -> Dict[str, Any]:
+        """Extract courses for a specific year's section of text using university config"""
+        # Locate every period's heading first. Real headings (whole words such as FALL) end the
+        # previous period's courses; a one-letter fallback hit (e.g. the S in "CSC") is not a
+        # boundary and only gets the fixed look-ahead window.
+        headings = [_find_first(year_text_lc, keywords) for keywords in self._period_keywords]
+        is_boundary = [heading is not None and _is_heading(year_text_lc, *heading) for heading in headings]
+        anchor_starts = sorted(heading[0] for heading, boundary in zip(headings, is_boundary) if boundary)
         
         # Extract courses by period (quarter/semester)
         periods = {}
-        for period_name in self.config.period_names:
-            keywords = self.config.quarter_keywords.get(period_name.lower(), [period_name])
-            periods[period_name.lower()] = self._extract_period_courses(year_text, keywords, period_name)
+        for period_name, period_key, heading, boundary in zip(
+                self.config.period_names, self._period_lc, headings, is_boundary):
+            if heading:
+                section_start = heading[1]
+                if boundary:
+                    i = bisect.bisect_left(anchor_starts, section_start)
+                    section_end = anchor_starts[i] if i < len(anchor_starts) else len(year_text)
+                else:
+                    section_end = min(section_start + _FALLBACK_PERIOD_WINDOW, len(year_text))
+                periods[period_key] = self._extract_period_courses(year_text, period_name, section_start, section_end)
+            else:
+                periods[period_key] = self._extract_period_courses(year_text, period_name, 0, 0)
         
         return periods
     
-    def _extract_period_courses(self, text: str, period_keywords: List[str], period_name: str) -> Dict[str, Any]:
-        """Extract courses for a specific period using university config"""
+    def _extract_period_courses(self, text: str, period_name: str, section_start: int, section_end: int) -> Dict[str, Any]:
+        """Extract courses for a specific period from text[section_start:section_end]"""
         courses = []
         total_units = 0
         
-        for keyword in period_keywords:
-            # Find section for this period
-            period_match = re.search(f'{keyword}', text, re.IGNORECASE)
-            if period_match:
-                # Extract courses from this section
-                section_start = period_match.end()
-                section_end = section_start + 500  # Look ahead 500 chars
-                section_text = text[section_start:section_end]
+        # Use university-specific course pattern; bounded finditer avoids slicing the section out
+        if section_end > section_start and self._course_re.groups >= 4:  # Ensure we have all required groups
+            for course_match in self._course_re.finditer(text, section_start, section_end):
+                # '' for unmatched optional groups, as findall would give
+                dept, number, name, units_text = course_match.groups('')[:4]
                 
-                # Use university-specific course pattern
-                matches = re.findall(self.config.course_pattern, section_text)
-                for match in matches:
-                    if len(match) >= 4:  # Ensure we have all required groups
-                        dept = match[0]
-                        number = match[1]
-                        name = match[2].strip()
-                        
-                        # Extract units using university-specific pattern
-                        units_match = re.search(self.config.units_pattern, match[3] if len(match) > 3 else "")
-                        units = int(units_match.group(1)) if units_match else 3
-                        
-                        courses.append({
-                            'course_id': f"{dept} {number}",
-                            'course_name': name,
-                            'units': units,
-                            'category': self._determine_course_category(dept, number),
-                            'prerequisites': []
-                        })
-                        total_units += units
+                units = self._parse_units(units_text)
                 
-                break
+                courses.append({
+                    'course_id': self._course_id(dept, number),
+                    'course_name': name.strip(),
+                    'units': units,
+                    'category': self._determine_course_category(dept, number),
+                    'prerequisites': []
+                })
+                total_units += units
         
         return {
             'period': period_name,
@@ -841,63 +736,59 @@ class UniversalFlowchartParser:
             'courses': courses
         }
     
+    def _course_id(self, dept: str, number: str) -> str:
+        """Return the shared course id string for a department and number"""
+        key = (dept, number)
+        course_id = self._id_cache.get(key)
+        if course_id is None:
+            course_id = self._id_cache.setdefault(key, f"{dept} {number}")
+        return course_id
+    
+    def _parse_units(self, units_text: str) -> int:
+        """Parse the units captured by course_pattern, defaulting to 3"""
+        # course_pattern already captures the bare number; only odd formats need units_pattern
+        if units_text.isdecimal():
+            return int(units_text)
+        units_match = self._units_re.search(units_text)
+        return int(units_match.group(1)) if units_match else 3
+    
     def _determine_course_category(self, dept: str, number: str) -> str:
         """Determine course category using university config"""
-        if dept in self.config.major_departments:
-            return 'major'
-        elif dept in self.config.support_departments:
-            return 'support'
-        elif number and number[0].isdigit() and int(number[0]) < 3:
-            return 'foundational'
-        else:
-            return 'elective'
-    
-    def _extract_tracks(self, text: str) -> List[Dict[str, Any]]:
-        """Extract track information using university config"""
-        tracks = []
-        
-        for pattern in self.config.track_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                track_name = match if isinstance(match, str) else match[0]
-                tracks.append({
-                    'track_name': track_name.strip(),
-                    'additional_requirements': []
-                })
-        
-        return tracks
+        category = self._dept_categories.get(dept)
+        if category is not None:
+            return category
+        return 'foundational' if number[:1] in _FOUNDATIONAL_LEVELS else 'elective'
     
     def _create_basic_structure(self, text: str) -> Dict[str, Any]:
         """Create basic structure when parsing fails"""
-        # Extract all courses and distribute them across years
-        all_courses = re.findall(self.config.course_pattern, text)
-        
-        years = {}
-        for i in range(1, 5):  # 4 years
-            years[f'year_{i}'] = {}
-            for period in self.config.period_names:
-                years[f'year_{i}'][period.lower()] = {'courses': [], 'total_units': 0}
-        
-        # Simple distribution
-        for i, match in enumerate(all_courses[:24]):  # Limit to 24 courses
-            if len(match) >= 4:
-                dept, number, name = match[0], match[1], match[2]
-                units_match = re.search(self.config.units_pattern, match[3] if len(match) > 3 else "")
-                units = int(units_match.group(1)) if units_match else 3
-                
-                year_num = min(int(number[0]) if number[0].isdigit() else 1, 4)
-                year_key = f'year_{year_num}'
-                period = self.config.period_names[i % len(self.config.period_names)].lower()
-                
-                course_info = {
-                    'course_id': f"{dept} {number}",
-                    'course_name': name.strip(),
-                    'units': units,
-                    'category': self._determine_course_category(dept, number)
-                }
-                
-                years[year_key][period]['courses'].append(course_info)
-                years[year_key][period]['total_units'] += units
+        period_lc = self._period_lc
+        years = {
+            f'year_{i}': {period: {'courses': [], 'total_units': 0} for period in period_lc}
+            for i in range(1, 5)  # 4 years
+        }
+        
+        # Simple distribution of the first courses found; finditer stops scanning once 24 are taken
+        if self._course_re.groups < 4:  # Need dept, number, name and units groups
+            return years
+        course_matches = itertools.islice(self._course_re.finditer(text), 24)  # Limit to 24 courses
+        for i, course_match in enumerate(course_matches):
+            # '' for unmatched optional groups, as findall would give
+            dept, number, name, units_text = course_match.groups('')[:4]
+            units = self._parse_units(units_text)
+            
+            year_num = min(int(number[0]) if number[0].isdigit() else 1, 4)
+            year_key = f'year_{year_num}'
+            period = period_lc[i % len(period_lc)]
+            
+            course_info = {
+                'course_id': self._course_id(dept, number),
+                'course_name': name.strip(),
+                'units': units,
+                'category': self._determine_course_category(dept, number)
+            }
+            
+            years[year_key][period]['courses'].append(course_info)
+            years[year_key][period]['total_units'] += units
         
         return years
     
@@ -905,49 +796,58 @@ class UniversalFlowchartParser:
         """Create a template flowchart when parsing fails"""
         logger.info(f"Creating template flowchart for {major} at {self.config.name}")
         
-        # Create basic template based on university system
-        template_flowchart = {}
+        template_flowchart = self._template_cache.get(major)
+        if template_flowchart is None:
+            template_flowchart = self._template_cache.setdefault(major, self._build_template_flowchart(major))
         
-        for year in range(1, 5):
-            year_key = f'year_{year}'
-            template_flowchart[year_key] = {}
-            
-            for period in self.config.period_names:
-                period_key = period.lower()
-                template_flowchart[year_key][period_key] = {
+        return CourseFlowchart(
+            university=self.config.name,
+            major=major,
+            academic_year="2024-2025",
+            catalog_year="2022-2026",
+            flowchart=template_flowchart,
+            tracks=[],
+            system=self.config.system
+        )
+    
+    def _build_template_flowchart(self, major: str) -> Dict[str, Any]:
+        """Build the generic four-year template for a major based on the university system"""
+        is_quarter = self.config.system == 'quarter'
+        period_units = 15 if is_quarter else 16
+        course_units = 4 if is_quarter else 3
+        core_name = f'{major} Core Course'
+        periods = tuple(zip(self.config.period_names, self._period_lc))
+        
+        return {
+            f'year_{year}': {
+                period_key: {
                     'period': f'{period} Year {year}',
-                    'total_units': 15 if self.config.system == 'quarter' else 16,
+                    'total_units': period_units,
                     'courses': [
                         {
                             'course_id': f'MAJOR {100 + year*10}',
-                            'course_name': f'{major} Core Course',
-                            'units': 4 if self.config.system == 'quarter' else 3,
+                            'course_name': core_name,
+                            'units': course_units,
                             'category': 'major'
                         },
                         {
                             'course_id': f'SUPPORT {100 + year*10}',
                             'course_name': 'Support Course',
-                            'units': 4 if self.config.system == 'quarter' else 3,
+                            'units': course_units,
                             'category': 'support'
                         },
                         {
                             'course_id': 'GE',
                             'course_name': 'General Education',
-                            'units': 4 if self.config.system == 'quarter' else 3,
+                            'units': course_units,
                             'category': 'ge'
                         }
                     ]
                 }
-        
-        return CourseFlowchart(
-            university=self.config.name,
-            major=major,
-            academic_year="2024-2025",
-            catalog_year="2022-2026",
-            flowchart=template_flowchart,
-            tracks=[],
-            system=self.config.system
-        )
+                for period, period_key in periods
+            }
+            for year in range(1, 5)
+        }
     
     def _convert_json_to_flowchart(self, data: Dict, major: str) -> CourseFlowchart:
         """Convert JSON data to flowchart format"""
@@ -955,6 +855,200 @@ class UniversalFlowchartParser:
         # For now, return template
         return self._create_template_flowchart(major)
 
+# DynamoDB key parts: lower-case, with spaces and hyphens turned into underscores in one pass
+_KEY_SEPARATORS = str.maketrans(' -', '__')
+
+@functools.lru_cache(maxsize=512)
+def _clean_major(major: str) -> str:
+    """Major name as used in DynamoDB keys"""
+    return major.lower().translate(_KEY_SEPARATORS)
+
+@functools.lru_cache(maxsize=512)
+def _clean_year(academic_year: str) -> str:
+    """Academic year as used in DynamoDB keys"""
+    return academic_year.replace('-', '_')
+
+_REQUIRED_CATEGORIES = ('major', 'support')
+# Course level comes from the first digit in the course id
+_FIRST_DIGIT = re.compile(r'\d').search
+
+# Raw parser categories -> categories stored in the degree plan
+_STANDARD_CATEGORIES = {
+    'major': 'major_core',
+    'support': 'major_support',
+    'ge': 'general_education',
+    'elective': 'elective',
+    'foundational': 'foundational'
+}
+
+@functools.lru_cache(maxsize=64)
+def _classify_category(category: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Standardized category, summary bucket ('' for none) and required-course filters for a raw category"""
+    category_lc = category.lower()
+    standard = _STANDARD_CATEGORIES.get(category_lc, category)
+    if 'major' in category_lc:
+        bucket = 'major'
+    elif 'support' in category_lc:
+        bucket = 'support'
+    elif 'ge' in category_lc or 'general' in category_lc:
+        bucket = 'ge'
+    else:
+        bucket = ''
+    return standard, bucket, tuple(
+        category_filter for category_filter in _REQUIRED_CATEGORIES if category_filter in category_lc
+    )
+
+# Categories the parsers emit, resolved up front; anything else goes through the cached classifier
+_CATEGORY_INFO = {
+    category: _classify_category(category)
+    for category in ('major', 'support', 'ge', 'elective', 'foundational',
+                     'major_core', 'major_support', 'general_education')
+}
+
+@functools.lru_cache(maxsize=None)
+def _get_ge_areas(university_key: str) -> Dict[str, Dict[str, Any]]:
+    """Get GE areas for specific university (cached; shared between items, do not mutate)"""
+    # University-specific GE requirements
+    if university_key == 'cal_poly':
+        return {
+            'A': {'name': 'English Language Communication', 'units': 12},
+            'B': {'name': 'Scientific Inquiry', 'units': 12},
+            'C': {'name': 'Arts and Humanities', 'units': 16},
+            'D': {'name': 'Social Sciences', 'units': 16},
+            'E': {'name': 'Lifelong Learning', 'units': 4},
+            'F': {'name': 'Ethnic Studies', 'units': 4}
+        }
+    elif university_key == 'uc_berkeley':
+        return {
+            'AC': {'name': 'American Cultures', 'units': 4},
+            'QR': {'name': 'Quantitative Reasoning', 'units': 4},
+            'RC': {'name': 'Reading and Composition', 'units': 8},
+            'FL': {'name': 'Foreign Language', 'units': 0}  # May be satisfied by other means
+        }
+    else:
+        # Generic GE structure
+        return {
+            'humanities': {'name': 'Humanities', 'units': 12},
+            'social_science': {'name': 'Social Sciences', 'units': 12},
+            'natural_science': {'name': 'Natural Sciences', 'units': 12},
+            'mathematics': {'name': 'Mathematics', 'units': 8}
+        }
+
+@functools.lru_cache(maxsize=None)
+def _create_milestones(academic_system: str) -> Dict[str, str]:
+    """Create academic milestones based on system (cached; shared between items, do not mutate)"""
+    if academic_system == 'quarter':
+        return {
+            'freshman_year': 'Complete foundational courses and adjust to university life',
+            'sophomore_year': 'Complete core major requirements and explore concentrations',
+            'junior_year': 'Complete advanced major courses and begin specialization',
+            'senior_year': 'Complete capstone projects and prepare for career/graduate school'
+        }
+    else:  # semester
+        return {
+            'freshman_year': 'Complete foundational courses and general education requirements',
+            'sophomore_year': 'Declare major and complete prerequisite courses',
+            'junior_year': 'Complete major core requirements and begin advanced coursework',
+            'senior_year': 'Complete capstone requirements and finalize degree'
+        }
+
+def _contains_float(obj: Any) -> bool:
+    """Check a DynamoDB item for floats (debug-only guard; the item is not modified)"""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is float:
+            return True
+        if node_type is dict:
+            stack.extend(node.values())
+        elif node_type is list or node_type is tuple:
+            stack.extend(node)
+    return False
+
+class _LazyConfigs(MutableMapping):
+    """University key -> config mapping that only builds a config when it is first accessed"""
+    
+    def __init__(self, factories: Dict[str, Callable[[], UniversityFlowchartConfig]]):
+        # Key order comes from _factories; a key added via __setitem__ has no factory (None)
+        self._factories: Dict[str, Optional[Callable[[], UniversityFlowchartConfig]]] = dict(factories)
+        self._configs: Dict[str, UniversityFlowchartConfig] = {}
+    
+    def __getitem__(self, key: str) -> UniversityFlowchartConfig:
+        config = self._configs.get(key)
+        if config is None:
+            factory = self._factories[key]
+            config = self._configs[key] = factory()
+        return config
+    
+    def __setitem__(self, key: str, config: UniversityFlowchartConfig) -> None:
+        self._configs[key] = config
+        self._factories.setdefault(key, None)
+    
+    def __delitem__(self, key: str) -> None:
+        del self._factories[key]
+        self._configs.pop(key, None)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+    
+    def __iter__(self):
+        return iter(self._factories)
+    
+    def __len__(self) -> int:
+        return len(self._factories)
+
+class _TokenBucket:
+    """Thread-safe token bucket; acquire() sleeps only as long as the rate requires"""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, waiting for it to be refilled if the bucket is empty"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Claim the token up front; a negative balance is the wait this caller owes
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+def _declared_size(response: requests.Response) -> Optional[int]:
+    """Content-Length of a response, or None when the server did not send one"""
+    content_length = response.headers.get('Content-Length', '')
+    return int(content_length) if content_length.isdigit() else None
+
+def _cacheable_size(response: requests.Response) -> bool:
+    """requests-cache filter: only cache bodies whose declared size is within MAX_FLOWCHART_BYTES"""
+    size = _declared_size(response)
+    return size is not None and size <= MAX_FLOWCHART_BYTES
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a host token before each network request and rejects bodies
+    declared larger than MAX_FLOWCHART_BYTES before they are read. requests-cache answers hits
+    without calling the adapter, so cached responses are never throttled."""
+    
+    def __init__(self, throttle: Callable[[str], None], **kwargs):
+        self._throttle = throttle
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        self._throttle(request.url)
+        response = super().send(request, **kwargs)
+        size = _declared_size(response)
+        if size is not None and size > MAX_FLOWCHART_BYTES:
+            response.close()
+            raise ValueError(f"Flowchart larger than {MAX_FLOWCHART_BYTES} bytes: {request.url}")
+        return response
+
 class UniversalFlowchartScraper:
     """Enhanced universal course flowchart scraper supporting multiple universities"""
     
@@ -962,19 +1056,48 @@ class UniversalFlowchartScraper:
         self.aws_region = aws_region
         self.table_name = table_name
         
-        # Setup HTTP session
-        self.session = requests.Session()
+        # Per-host token buckets so concurrent downloads stay polite to each server
+        self._buckets_lock = threading.Lock()
+        self._buckets: Dict[str, _TokenBucket] = defaultdict(
+            lambda: _TokenBucket(rate=HOST_REQUEST_RATE, burst=HOST_REQUEST_BURST)
+        )
+        
+        # Setup HTTP session (cached when requests-cache is available). Only responses with a
+        # known, in-bounds size are cached: the cache reads the whole body before we see it.
+        if REQUESTS_CACHE_SUPPORT:
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_NAME,
+                expire_after=HTTP_CACHE_EXPIRE_SECONDS,
+                cache_control=True,
+                filter_fn=_cacheable_size
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/pdf,text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive'
         })
+        # Keep-alive pool sized for the download threads, with backoff on transient errors;
+        # the adapter applies the host throttle, so only real network requests wait for a token
+        adapter = _ThrottledAdapter(
+            self._wait_for_host,
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=HTTP_RETRY_STATUSES,
+                allowed_methods=frozenset(['GET', 'HEAD'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
-        # Load university configurations
+        # Load university configurations; configs and parsers are built on first use
         self.university_configs = self._load_university_configs()
-        self.parsers = {}
-        self._initialize_parsers()
+        self.parsers: Dict[str, UniversalFlowchartParser] = {}
         
         # Initialize AWS
         self.dynamodb = None
@@ -985,147 +1108,163 @@ class UniversalFlowchartScraper:
         self._check_pdf_support()
     
     def _load_university_configs(self) -> Dict[str, UniversityFlowchartConfig]:
-        """Load configurations for different universities"""
-        return {
-            'cal_poly': UniversityFlowchartConfig(
-                name="California Polytechnic State University",
-                short_name="Cal Poly SLO",
-                location="San Luis Obispo, California",
-                system="quarter",
-                website="https://www.calpoly.edu",
-                flowchart_base_url="https://flowcharts.calpoly.edu/downloads/mymap/",
-                flowchart_urls={
-                    "Computer Science": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.52CSCBSU.pdf",
-                    "Software Engineering": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.53SEBSU.pdf",
-                    "Computer Engineering": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.14CPEBSU.pdf",
-                    "Mathematics": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.28MATBSU.pdf",
-                    "Statistics": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.32STABSU.pdf"
-                },
-                content_type="pdf",
-                year_patterns=[
-                    (r'FIRST\s+YEAR|FRESHMAN', 'year_1'),
-                    (r'SECOND\s+YEAR|SOPHOMORE', 'year_2'),
-                    (r'THIRD\s+YEAR|JUNIOR', 'year_3'),
-                    (r'FOURTH\s+YEAR|SENIOR', 'year_4')
-                ],
-                quarter_keywords={
-                    'fall': ['FALL', 'F'],
-                    'winter': ['WINTER', 'W'],
-                    'spring': ['SPRING', 'S']
-                },
-                course_pattern=r'([A-Z]{2,4})\s*(\d{3}[A-Z]*)\s*([^(]*?)\s*\((\d+)\)',
-                units_pattern=r'(\d+)',
-                prerequisite_patterns=[r'Prerequisite[s]?[:\s]+(.*?)(?:\.|$|\n|\d+\s*units?)'],
-                track_patterns=[r'CONCENTRATION[S]?[:\s]+([^.]+)', r'TRACK[S]?[:\s]+([^.]+)'],
-                major_departments=['CSC', 'CPE', 'SE'],
-                support_departments=['MATH', 'STAT', 'PHYS', 'CHEM'],
-                periods_per_year=3,
-                period_names=['Fall', 'Winter', 'Spring']
-            ),
-            
-            'uc_berkeley': UniversityFlowchartConfig(
-                name="University of California, Berkeley",
-                short_name="UC Berkeley",
-                location="Berkeley, California",
-                system="semester",
-                website="https://www.berkeley.edu",
-                flowchart_base_url="https://eecs.berkeley.edu/academics/undergraduate/",
-                flowchart_urls={
-                    "Computer Science": "https://eecs.berkeley.edu/academics/undergraduate/cs-major",
-                    "Electrical Engineering": "https://eecs.berkeley.edu/academics/undergraduate/ee-major",
-                    "Mathematics": "https://math.berkeley.edu/programs/undergraduate/major"
-                },
-                content_type="html",
-                year_patterns=[
-                    (r'FRESHMAN|FIRST\s+YEAR', 'year_1'),
-                    (r'SOPHOMORE|SECOND\s+YEAR', 'year_2'),
-                    (r'JUNIOR|THIRD\s+YEAR', 'year_3'),
-                    (r'SENIOR|FOURTH\s+YEAR', 'year_4')
-                ],
-                quarter_keywords={
-                    'fall': ['FALL', 'F'],
-                    'spring': ['SPRING', 'S']
-                },
-                course_pattern=r'([A-Z]+)\s*(\d+[A-Z]*)\s*-?\s*([^(]+?)(?:\((\d+)\s*units?\))?',
-                units_pattern=r'(\d+)',
-                prerequisite_patterns=[r'Prerequisites?[:\s]+(.*?)(?:\.|$|\n)'],
-                track_patterns=[r'CONCENTRATION[S]?[:\s]+([^.]+)', r'TRACK[S]?[:\s]+([^.]+)'],
-                major_departments=['CS', 'EECS', 'EE'],
-                support_departments=['MATH', 'STAT', 'PHYSICS'],
-                periods_per_year=2,
-                period_names=['Fall', 'Spring']
-            ),
-            
-            'stanford': UniversityFlowchartConfig(
-                name="Stanford University",
-                short_name="Stanford",
-                location="Stanford, California",
-                system="quarter",
-                website="https://www.stanford.edu",
-                flowchart_base_url="https://cs.stanford.edu/degrees/undergrad/",
-                flowchart_urls={
-                    "Computer Science": "https://cs.stanford.edu/degrees/undergrad/Requirements.shtml",
-                    "Mathematics": "https://mathematics.stanford.edu/academics/undergraduate-program"
-                },
-                content_type="html",
-                year_patterns=[
-                    (r'FRESHMAN|FIRST\s+YEAR', 'year_1'),
-                    (r'SOPHOMORE|SECOND\s+YEAR', 'year_2'),
-                    (r'JUNIOR|THIRD\s+YEAR', 'year_3'),
-                    (r'SENIOR|FOURTH\s+YEAR', 'year_4')
-                ],
-                quarter_keywords={
-                    'autumn': ['AUTUMN', 'FALL', 'A'],
-                    'winter': ['WINTER', 'W'],
-                    'spring': ['SPRING', 'S']
-                },
-                course_pattern=r'([A-Z]+)\s*(\d+[A-Z]*)\s*[:\-]?\s*([^(]+?)(?:\((\d+)\s*units?\))?',
-                units_pattern=r'(\d+)',
-                prerequisite_patterns=[r'Prerequisites?[:\s]+(.*?)(?:\.|$|\n)'],
-                track_patterns=[r'SPECIALIZATION[S]?[:\s]+([^.]+)', r'TRACK[S]?[:\s]+([^.]+)'],
-                major_departments=['CS', 'MATH'],
-                support_departments=['MATH', 'STATS', 'PHYSICS'],
-                periods_per_year=3,
-                period_names=['Autumn', 'Winter', 'Spring']
-            ),
-            
-            'mit': UniversityFlowchartConfig(
-                name="Massachusetts Institute of Technology",
-                short_name="MIT",
-                location="Cambridge, Massachusetts",
-                system="semester",
-                website="https://web.mit.edu",
-                flowchart_base_url="https://www.eecs.mit.edu/academics/undergraduate-programs/",
-                flowchart_urls={
-                    "Computer Science": "https://www.eecs.mit.edu/academics/undergraduate-programs/curriculum/6-3-computer-science-and-engineering/",
-                    "Electrical Engineering": "https://www.eecs.mit.edu/academics/undergraduate-programs/curriculum/6-1-electrical-science-and-engineering/"
-                },
-                content_type="html",
-                year_patterns=[
-                    (r'FRESHMAN|FIRST\s+YEAR', 'year_1'),
-                    (r'SOPHOMORE|SECOND\s+YEAR', 'year_2'),
-                    (r'JUNIOR|THIRD\s+YEAR', 'year_3'),
-                    (r'SENIOR|FOURTH\s+YEAR', 'year_4')
-                ],
-                quarter_keywords={
-                    'fall': ['FALL', 'F'],
-                    'spring': ['SPRING', 'IAP', 'S']
-                },
-                course_pattern=r'(\d+)\.(\d+[A-Z]*)\s*([^(]+?)(?:\((\d+)-\d+-\d+\))?',
-                units_pattern=r'(\d+)',
-                prerequisite_patterns=[r'Prerequisites?[:\s]+(.*?)(?:\.|$|\n)'],
-                track_patterns=[r'CONCENTRATION[S]?[:\s]+([^.]+)'],
-                major_departments=['6', '18', '8'],
-                support_departments=['18', '8', '2'],
-                periods_per_year=2,
-                period_names=['Fall', 'Spring']
-            )
-        }
+        """Load configurations for different universities (each one is built on first access)"""
+        return _LazyConfigs({
+            'cal_poly': self._build_calpoly_config,
+            'uc_berkeley': self._build_uc_berkeley_config,
+            'stanford': self._build_stanford_config,
+            'mit': self._build_mit_config
+        })
+    
+    def _build_calpoly_config(self) -> UniversityFlowchartConfig:
+        """Configuration for Cal Poly SLO"""
+        return UniversityFlowchartConfig(
+            name="California Polytechnic State University",
+            short_name="Cal Poly SLO",
+            location="San Luis Obispo, California",
+            system="quarter",
+            website="https://www.calpoly.edu",
+            flowchart_base_url="https://flowcharts.calpoly.edu/downloads/mymap/",
+            flowchart_urls={
+                "Computer Science": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.52CSCBSU.pdf",
+                "Software Engineering": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.53SEBSU.pdf",
+                "Computer Engineering": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.14CPEBSU.pdf",
+                "Mathematics": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.28MATBSU.pdf",
+                "Statistics": "https://flowcharts.calpoly.edu/downloads/mymap/22-26.32STABSU.pdf"
+            },
+            content_type="pdf",
+            year_patterns=[
+                (r'FIRST\s+YEAR|FRESHMAN', 'year_1'),
+                (r'SECOND\s+YEAR|SOPHOMORE', 'year_2'),
+                (r'THIRD\s+YEAR|JUNIOR', 'year_3'),
+                (r'FOURTH\s+YEAR|SENIOR', 'year_4')
+            ],
+            quarter_keywords={
+                'fall': ['FALL', 'F'],
+                'winter': ['WINTER', 'W'],
+                'spring': ['SPRING', 'S']
+            },
+            course_pattern=r'([A-Z]{2,4})\s*(\d{3}[A-Z]*)\s*([^()\n]*?)\s*\((\d+)\)',
+            units_pattern=r'(\d+)',
+            prerequisite_patterns=[r'Prerequisite[s]?[:\s]+(.*?)(?:\.|$|\n|\d+\s*units?)'],
+            track_patterns=[r'CONCENTRATION[S]?[:\s]+([^.]+)', r'TRACK[S]?[:\s]+([^.]+)'],
+            major_departments=['CSC', 'CPE', 'SE'],
+            support_departments=['MATH', 'STAT', 'PHYS', 'CHEM'],
+            periods_per_year=3,
+            period_names=['Fall', 'Winter', 'Spring']
+        )
+    
+    def _build_uc_berkeley_config(self) -> UniversityFlowchartConfig:
+        """Configuration for UC Berkeley"""
+        return UniversityFlowchartConfig(
+            name="University of California, Berkeley",
+            short_name="UC Berkeley",
+            location="Berkeley, California",
+            system="semester",
+            website="https://www.berkeley.edu",
+            flowchart_base_url="https://eecs.berkeley.edu/academics/undergraduate/",
+            flowchart_urls={
+                "Computer Science": "https://eecs.berkeley.edu/academics/undergraduate/cs-major",
+                "Electrical Engineering": "https://eecs.berkeley.edu/academics/undergraduate/ee-major",
+                "Mathematics": "https://math.berkeley.edu/programs/undergraduate/major"
+            },
+            content_type="html",
+            year_patterns=[
+                (r'FRESHMAN|FIRST\s+YEAR', 'year_1'),
+                (r'SOPHOMORE|SECOND\s+YEAR', 'year_2'),
+                (r'JUNIOR|THIRD\s+YEAR', 'year_3'),
+                (r'SENIOR|FOURTH\s+YEAR', 'year_4')
+            ],
+            quarter_keywords={
+                'fall': ['FALL', 'F'],
+                'spring': ['SPRING', 'S']
+            },
+            course_pattern=r'([A-Z]+)\s*(\d+[A-Z]*)\s*-?\s*([^(]+?)(?:\((\d+)\s*units?\))?',
+            units_pattern=r'(\d+)',
+            prerequisite_patterns=[r'Prerequisites?[:\s]+(.*?)(?:\.|$|\n)'],
+            track_patterns=[r'CONCENTRATION[S]?[:\s]+([^.]+)', r'TRACK[S]?[:\s]+([^.]+)'],
+            major_departments=['CS', 'EECS', 'EE'],
+            support_departments=['MATH', 'STAT', 'PHYSICS'],
+            periods_per_year=2,
+            period_names=['Fall', 'Spring']
+        )
+    
+    def _build_stanford_config(self) -> UniversityFlowchartConfig:
+        """Configuration for Stanford"""
+        return UniversityFlowchartConfig(
+            name="Stanford University",
+            short_name="Stanford",
+            location="Stanford, California",
+            system="quarter",
+            website="https://www.stanford.edu",
+            flowchart_base_url="https://cs.stanford.edu/degrees/undergrad/",
+            flowchart_urls={
+                "Computer Science": "https://cs.stanford.edu/degrees/undergrad/Requirements.shtml",
+                "Mathematics": "https://mathematics.stanford.edu/academics/undergraduate-program"
+            },
+            content_type="html",
+            year_patterns=[
+                (r'FRESHMAN|FIRST\s+YEAR', 'year_1'),
+                (r'SOPHOMORE|SECOND\s+YEAR', 'year_2'),
+                (r'JUNIOR|THIRD\s+YEAR', 'year_3'),
+                (r'SENIOR|FOURTH\s+YEAR', 'year_4')
+            ],
+            quarter_keywords={
+                'autumn': ['AUTUMN', 'FALL', 'A'],
+                'winter': ['WINTER', 'W'],
+                'spring': ['SPRING', 'S']
+            },
+            course_pattern=r'([A-Z]+)\s*(\d+[A-Z]*)\s*[:\-]?\s*([^(]+?)(?:\((\d+)\s*units?\))?',
+            units_pattern=r'(\d+)',
+            prerequisite_patterns=[r'Prerequisites?[:\s]+(.*?)(?:\.|$|\n)'],
+            track_patterns=[r'SPECIALIZATION[S]?[:\s]+([^.]+)', r'TRACK[S]?[:\s]+([^.]+)'],
+            major_departments=['CS', 'MATH'],
+            support_departments=['MATH', 'STATS', 'PHYSICS'],
+            periods_per_year=3,
+            period_names=['Autumn', 'Winter', 'Spring']
+        )
     
-    def _initialize_parsers(self):
-        """Initialize parsers for each university"""
-        for key, config in self.university_configs.items():
-            self.parsers[key] = UniversalFlowchartParser(config)
+    def _build_mit_config(self) -> UniversityFlowchartConfig:
+        """Configuration for MIT"""
+        return UniversityFlowchartConfig(
+            name="Massachusetts Institute of Technology",
+            short_name="MIT",
+            location="Cambridge, Massachusetts",
+            system="semester",
+            website="https://web.mit.edu",
+            flowchart_base_url="https://www.eecs.mit.edu/academics/undergraduate-programs/",
+            flowchart_urls={
+                "Computer Science": "https://www.eecs.mit.edu/academics/undergraduate-programs/curriculum/6-3-computer-science-and-engineering/",
+                "Electrical Engineering": "https://www.eecs.mit.edu/academics/undergraduate-programs/curriculum/6-1-electrical-science-and-engineering/"
+            },
+            content_type="html",
+            year_patterns=[
+                (r'FRESHMAN|FIRST\s+YEAR', 'year_1'),
+                (r'SOPHOMORE|SECOND\s+YEAR', 'year_2'),
+                (r'JUNIOR|THIRD\s+YEAR', 'year_3'),
+                (r'SENIOR|FOURTH\s+YEAR', 'year_4')
+            ],
+            quarter_keywords={
+                'fall': ['FALL', 'F'],
+                'spring': ['SPRING', 'IAP', 'S']
+            },
+            course_pattern=r'(\d+)\.(\d+[A-Z]*)\s*([^(]+?)(?:\((\d+)-\d+-\d+\))?',
+            units_pattern=r'(\d+)',
+            prerequisite_patterns=[r'Prerequisites?[:\s]+(.*?)(?:\.|$|\n)'],
+            track_patterns=[r'CONCENTRATION[S]?[:\s]+([^.]+)'],
+            major_departments=['6', '18', '8'],
+            support_departments=['18', '8', '2'],
+            periods_per_year=2,
+            period_names=['Fall', 'Spring']
+        )
+    
+    def _get_parser(self, university_key: str) -> UniversalFlowchartParser:
+        """Return the parser for a university, creating it on first use"""
+        parser = self.parsers.get(university_key)
+        if parser is None:
+            parser = UniversalFlowchartParser(self.university_configs[university_key])
+            self.parsers[university_key] = parser
+        return parser
     
     def add_university_config(self, key: str, config: UniversityFlowchartConfig) -> None:
         """Add a new university configuration"""
@@ -1135,18 +1274,27 @@ class UniversalFlowchartScraper:
     
     def _check_pdf_support(self):
         """Check and report PDF parsing capabilities"""
-        if PDFPLUMBER_SUPPORT:
-            logger.info("✅ pdfplumber available - best PDF parsing")
+        if PYMUPDF_SUPPORT:
+            logger.info("✅ PyMuPDF available - fastest PDF parsing")
+        elif PDFPLUMBER_SUPPORT:
+            logger.info("✅ pdfplumber available - accurate PDF parsing")
         elif PDF_SUPPORT:
             logger.info("⚠️  PyPDF2 available - basic PDF parsing")
         else:
-            logger.warning("❌ No PDF libraries found. Install with: pip install pdfplumber PyPDF2")
+            logger.warning("❌ No PDF libraries found. Install with: pip install pymupdf pdfplumber PyPDF2")
             logger.info("Will create template flowcharts instead")
     
     def _init_aws(self) -> None:
         """Initialize AWS DynamoDB connection"""
         try:
-            self.dynamodb = boto3.resource('dynamodb', region_name=self.aws_region)
+            self.dynamodb = boto3.resource(
+                'dynamodb',
+                region_name=self.aws_region,
+                config=Config(
+                    max_pool_connections=DYNAMODB_MAX_POOL_CONNECTIONS,
+                    retries={'max_attempts': DYNAMODB_CLIENT_MAX_ATTEMPTS, 'mode': 'adaptive'}
+                )
+            )
             self.table = self.dynamodb.Table(self.table_name)
             logger.info("AWS DynamoDB client initialized successfully")
         except NoCredentialsError:
@@ -1162,16 +1310,16 @@ class UniversalFlowchartScraper:
     
     def get_university_majors(self, university_key: str) -> List[str]:
         """Get available majors for a university"""
-        if university_key in self.parsers:
-            return list(self.parsers[university_key].get_flowchart_urls().keys())
+        if university_key in self.university_configs:
+            return list(self.university_configs[university_key].flowchart_urls.keys())
         return []
     
     def scrape_university(self, university_key: str, majors: Optional[List[str]] = None) -> Dict[str, Any]:
         """Scrape course flowcharts for a specific university"""
-        if university_key not in self.parsers:
-            raise ValueError(f"University '{university_key}' not supported. Available: {list(self.parsers.keys())}")
+        if university_key not in self.university_configs:
+            raise ValueError(f"University '{university_key}' not supported. Available: {list(self.university_configs.keys())}")
         
-        parser = self.parsers[university_key]
+        parser = self._get_parser(university_key)
         university_info = parser.get_university_info()
         flowchart_urls = parser.get_flowchart_urls()
         
@@ -1194,33 +1342,34 @@ class UniversalFlowchartScraper:
         
         flowcharts = []
         
-        for major, url in flowchart_urls.items():
-            logger.info(f"\n{'='*50}")
-            logger.info(f"🔍 Scraping {major} flowchart")
-            logger.info(f"📄 URL: {url}")
+        # Download and parse concurrently; each worker thread parses its own flowchart, with
+        # the CPU-bound PDF text extraction handed off to the shared worker processes
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_DOWNLOAD_WORKERS, len(flowchart_urls)))) as executor:
+            futures = {
+                executor.submit(self._download_and_parse, parser, url, major): major
+                for major, url in flowchart_urls.items()
+            }
             
-            try:
-                # Download content
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse flowchart
-                flowchart = parser.parse_flowchart(response.content, major)
+            for future in as_completed(futures):
+                major = futures[future]
+                logger.info(f"\n{'='*50}")
+                logger.info(f"🔍 Scraping {major} flowchart")
+                logger.info(f"📄 URL: {flowchart_urls[major]}")
                 
-                if flowchart:
-                    flowcharts.append(flowchart)
-                    results["successful_majors"].append(major)
-                    logger.info(f"✅ Successfully parsed {major} flowchart")
-                else:
+                try:
+                    flowchart = future.result()
+                    
+                    if flowchart:
+                        flowcharts.append(flowchart)
+                        results["successful_majors"].append(major)
+                        logger.info(f"✅ Successfully parsed {major} flowchart")
+                    else:
+                        results["failed_majors"].append(major)
+                        logger.warning(f"❌ Failed to parse {major} flowchart")
+                    
+                except Exception as e:
+                    logger.error(f"❌ Error scraping {major} flowchart: {e}")
                     results["failed_majors"].append(major)
-                    logger.warning(f"❌ Failed to parse {major} flowchart")
-                
-                # Be respectful to server
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"❌ Error scraping {major} flowchart: {e}")
-                results["failed_majors"].append(major)
         
         # Save to DynamoDB
         if flowcharts:
@@ -1230,6 +1379,37 @@ class UniversalFlowchartScraper:
         
         return results
     
+    def _download_and_parse(self, parser: UniversalFlowchartParser, url: str, major: str) -> Optional[CourseFlowchart]:
+        """Download one flowchart and parse it (runs on a worker thread)"""
+        content = self._download_flowchart(url)
+        return parser.parse_flowchart(content, major)
+    
+    def _wait_for_host(self, url: str) -> None:
+        """Wait for a token from this host's bucket to be respectful to the server"""
+        host = urlparse(url).netloc
+        with self._buckets_lock:
+            bucket = self._buckets[host]
+        bucket.acquire()
+    
+    def _download_flowchart(self, url: str) -> bytes:
+        """Download flowchart content (runs on a worker thread), capped at MAX_FLOWCHART_BYTES"""
+        # Host throttling and the Content-Length check happen in _ThrottledAdapter
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            
+            # Stream with a size cap so runaway responses without a Content-Length (never cached)
+            # fail early; chunks are joined once at the end (a single copy) rather than grown in a
+            # BytesIO and copied out again
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                size += len(chunk)
+                if size > MAX_FLOWCHART_BYTES:
+                    raise ValueError(f"Flowchart larger than {MAX_FLOWCHART_BYTES} bytes: {url}")
+                chunks.append(chunk)
+            
+            return b"".join(chunks)
+    
     def scrape_multiple_universities(self, university_keys: List[str], majors_per_university: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """Scrape flowcharts from multiple universities"""
         logger.info(f"🌍 Batch scraping from {len(university_keys)} universities")
@@ -1243,72 +1423,80 @@ class UniversalFlowchartScraper:
             "total_save_errors": 0
         }
         
-        for uni_key in university_keys:
-            logger.info(f"\n{'='*80}")
-            logger.info(f"🏫 Starting {uni_key}")
-            
-            try:
+        # Universities are independent and I/O-bound, so scrape them concurrently. Workers share
+        # the pooled session (per-host token buckets keep each server throttled) and the table.
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_UNIVERSITY_WORKERS, len(university_keys)))) as executor:
+            futures = {}
+            for uni_key in university_keys:
+                logger.info(f"\n{'='*80}")
+                logger.info(f"🏫 Starting {uni_key}")
                 majors = majors_per_university.get(uni_key) if majors_per_university else None
-                results = self.scrape_university(uni_key, majors)
-                all_results[uni_key] = results
-                
-                if results["save_success"] > 0:
-                    total_summary["universities_successful"] += 1
-                
-                total_summary["total_flowcharts"] += results["total_majors"]
-                total_summary["total_save_success"] += results["save_success"]
-                total_summary["total_save_errors"] += results["save_errors"]
-                
-                self.print_summary(results)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to scrape {uni_key}: {e}")
-                all_results[uni_key] = {"error": str(e)}
+                futures[executor.submit(self.scrape_university, uni_key, majors)] = uni_key
+            
+            # Tally and print on this thread as each university finishes
+            for future in as_completed(futures):
+                uni_key = futures[future]
+                try:
+                    results = future.result()
+                    all_results[uni_key] = results
+                    
+                    if results["save_success"] > 0:
+                        total_summary["universities_successful"] += 1
+                    
+                    total_summary["total_flowcharts"] += results["total_majors"]
+                    total_summary["total_save_success"] += results["save_success"]
+                    total_summary["total_save_errors"] += results["save_errors"]
+                    
+                    self.print_summary(results)
+                    
+                except Exception as e:
+                    logger.error(f"❌ Failed to scrape {uni_key}: {e}")
+                    all_results[uni_key] = {"error": str(e)}
+        
+        # Report in the order the universities were requested
+        all_results = {uni_key: all_results[uni_key] for uni_key in university_keys}
         
         # Print overall summary
         self._print_batch_summary(total_summary, all_results)
         return all_results
     
-    def _convert_floats_to_decimals(self, obj):
-        """Recursively convert float values to Decimal for DynamoDB compatibility"""
-        if isinstance(obj, float):
-            return Decimal(str(obj))
-        elif isinstance(obj, dict):
-            return {key: self._convert_floats_to_decimals(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_floats_to_decimals(item) for item in obj]
-        else:
-            return obj
-    
     def _save_flowcharts(self, flowcharts: List[CourseFlowchart], university_key: str) -> Tuple[int, int]:
         """Save flowcharts to DynamoDB in AI-optimized format"""
         logger.info(f"💾 Saving {len(flowcharts)} flowcharts to DynamoDB (AI-optimized format)...")
         
         success_count = 0
         error_count = 0
+        items = []
+        # Every item saved in this batch carries the same timestamp
+        last_updated = time.strftime('%Y-%m-%d %H:%M:%S')
         
         for flowchart in flowcharts:
             try:
-                # Create optimized item structure
-                item = self._create_optimized_item(flowchart, university_key)
+                # Create optimized item structure (numbers are already int or Decimal)
+                item = self._create_optimized_item(flowchart, university_key, last_updated)
+                assert not _contains_float(item), f"float in {flowchart.major} item; use Decimal at the source"
+                items.append((flowchart.major, item))
                 
-                # Convert floats to decimals for DynamoDB compatibility
-                item = self._convert_floats_to_decimals(item)
-                
-                # Save to DynamoDB
-                self.table.put_item(Item=item)
-                success_count += 1
-                logger.info(f"✅ Saved {flowchart.major} flowchart (optimized)")
-                
-                # Rate limiting
-                time.sleep(0.1)
+            except Exception as e:
+                error_count += 1
+                logger.error(f"❌ Unexpected error preparing {flowchart.major} flowchart: {e}")
+        
+        # One BatchWriteItem-sized chunk at a time, so a failure or retry only affects 25 items
+        for start in range(0, len(items), DYNAMODB_BATCH_SIZE):
+            chunk = items[start:start + DYNAMODB_BATCH_SIZE]
+            try:
+                self._write_batch([item for _, item in chunk])
                 
+                success_count += len(chunk)
+                for major, _ in chunk:
+                    logger.info(f"✅ Saved {major} flowchart (optimized)")
+                    
             except ClientError as e:
-                error_count += 1
-                logger.error(f"❌ Failed to save {flowchart.major} flowchart: {e}")
+                error_count += len(chunk)
+                logger.error(f"❌ Failed to save flowchart batch: {e}")
             except Exception as e:
-                error_count += 1
-                logger.error(f"❌ Unexpected error saving {flowchart.major} flowchart: {e}")
+                error_count += len(chunk)
+                logger.error(f"❌ Unexpected error saving flowchart batch: {e}")
         
         logger.info(f"✅ Saved {success_count} flowcharts successfully")
         if error_count > 0:
@@ -1316,17 +1504,37 @@ class UniversalFlowchartScraper:
         
         return success_count, error_count
     
-    def _create_optimized_item(self, flowchart: CourseFlowchart, university_key: str) -> Dict[str, Any]:
+    def _write_batch(self, items: List[Dict[str, Any]]) -> None:
+        """Write items with batch_writer, backing off and retrying while DynamoDB throttles"""
+        for attempt in range(MAX_WRITE_ATTEMPTS):
+            try:
+                # batch_writer sends the puts as BatchWriteItem calls and resubmits unprocessed items
+                with self.table.batch_writer(overwrite_by_pkeys=['university_major_year']) as batch:
+                    for item in items:
+                        batch.put_item(Item=item)
+                return
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code')
+                if error_code not in THROTTLING_ERROR_CODES or attempt == MAX_WRITE_ATTEMPTS - 1:
+                    raise
+                # Puts are full overwrites, so resending the whole batch is safe. Full jitter keeps
+                # the university threads from retrying in lockstep.
+                delay = random.uniform(0, min(WRITE_BACKOFF_CAP_SECONDS, WRITE_BACKOFF_SECONDS * (2 ** attempt)))
+                logger.warning(f"⏳ DynamoDB throttled ({error_code}), retrying batch in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _create_optimized_item(self, flowchart: CourseFlowchart, university_key: str,
+                               last_updated: Optional[str] = None) -> Dict[str, Any]:
         """Create AI-optimized flowchart item for DynamoDB"""
-        major_clean = flowchart.major.lower().replace(' ', '_').replace('-', '_')
-        year_clean = flowchart.academic_year.replace('-', '_')
+        if last_updated is None:
+            last_updated = time.strftime('%Y-%m-%d %H:%M:%S')
+        major_clean = _clean_major(flowchart.major)
+        year_clean = _clean_year(flowchart.academic_year)
         
-        # Calculate totals and extract requirements
-        degree_plan = self._optimize_flowchart_structure(flowchart.flowchart)
-        total_units = self._calculate_total_units(flowchart.flowchart)
-        requirements = self._extract_requirements(flowchart, university_key)
-        progression_rules = self._extract_progression_rules(flowchart, university_key)
-        summary = self._create_summary(flowchart.flowchart, total_units)
+        # Calculate totals and extract requirements (one walk over the flowchart)
+        digest = self._digest_flowchart(flowchart.flowchart, flowchart.system)
+        requirements = self._extract_requirements(digest, university_key)
+        progression_rules = self._extract_progression_rules(digest)
         
         return {
             'university_major_year': f"{university_key}_{major_clean}_{year_clean}",
@@ -1336,128 +1544,130 @@ class UniversalFlowchartScraper:
                 'university': flowchart.university,
                 'major': flowchart.major,
                 'degree_type': 'Bachelor of Science',  # Could be extracted/configured
-                'total_units': total_units,
+                'total_units': digest.total_units,
                 'academic_system': flowchart.system,
                 'typical_duration': '4 years',
-                'last_updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'last_updated': last_updated,
                 'catalog_year': flowchart.catalog_year
             },
-            'summary': summary,
-            'degree_plan': degree_plan,
+            'summary': digest.summary,
+            'degree_plan': digest.degree_plan,
             'requirements': requirements,
             'tracks': self._optimize_tracks(flowchart.tracks),
             'progression_rules': progression_rules,
-            'milestones': self._create_milestones(flowchart.system)
+            'milestones': _create_milestones(flowchart.system)
         }
     
-    def _optimize_flowchart_structure(self, flowchart_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert raw flowchart data to optimized structure"""
-        optimized = {}
-        
+    def _digest_flowchart(self, flowchart_data: Dict[str, Any], system: str) -> FlowchartDigest:
+        """Build the optimized degree plan, unit totals, required courses and progression data in one pass"""
+        # The period label key depends only on the university's academic system
+        period_name_key = 'quarter_name' if system == 'quarter' else 'semester_name'
+        degree_plan = {}
+        total_units = 0
+        bucket_units = {'major': 0, 'support': 0, 'ge': 0, '': 0}
+        periods_per_year = 0
+        # Insertion-ordered dicts de-duplicate while keeping flowchart order
+        required_courses = {category: {} for category in _REQUIRED_CATEGORIES}
+        prerequisites = {}
+        courses_by_level = {'100': [], '200': [], '300': [], '400': []}
         for year_key, year_data in flowchart_data.items():
-            if not isinstance(year_data, dict):
+            if type(year_data) is not dict:
                 continue
-                
-            optimized[year_key] = {}
+            
+            periods_per_year = max(periods_per_year, len(year_data))
+            optimized_year = degree_plan[year_key] = {}
             
             for period_key, period_data in year_data.items():
-                if not isinstance(period_data, dict):
+                if type(period_data) is not dict:
                     continue
-                    
-                # Clean up the period data structure
-                courses = period_data.get('courses', [])
+                
+                period_units = int(period_data.get('total_units', 0))
+                total_units += period_units
                 optimized_courses = []
                 
-                for course in courses:
-                    if isinstance(course, dict):
-                        optimized_course = {
-                            'course_id': course.get('course_id', ''),
-                            'course_name': course.get('course_name', ''),
-                            'units': int(course.get('units', 3)),
-                            'category': self._standardize_category(course.get('category', 'elective')),
-                            'prerequisites': course.get('prerequisites', []),
-                            'description': course.get('description', '')
-                        }
-                        
-                        # Add GE area if applicable
-                        if 'ge_area' in course:
-                            optimized_course['ge_area'] = course['ge_area']
-                        
-                        # Add course options if applicable
-                        if 'options' in course:
-                            optimized_course['options'] = course['options']
-                            
-                        optimized_courses.append(optimized_course)
+                for course in period_data.get('courses', []):
+                    if type(course) is not dict:
+                        continue
+                    
+                    course_id = course.get('course_id', '')
+                    category = course.get('category', 'elective')
+                    standard_category, bucket, required_filters = (
+                        _CATEGORY_INFO.get(category) or _classify_category(category)
+                    )
+                    units = int(course.get('units', 3))
+                    prereqs = course.get('prerequisites', [])
+                    
+                    # Clean up the course structure
+                    optimized_course = {
+                        'course_id': course_id,
+                        'course_name': course.get('course_name', ''),
+                        'units': units,
+                        'category': standard_category,
+                        'prerequisites': prereqs,
+                        'description': course.get('description', '')
+                    }
+                    
+                    # Add GE area if applicable
+                    if 'ge_area' in course:
+                        optimized_course['ge_area'] = course['ge_area']
+                    
+                    # Add course options if applicable
+                    if 'options' in course:
+                        optimized_course['options'] = course['options']
+                    
+                    optimized_courses.append(optimized_course)
+                    
+                    # Count units by category (courses without units count as 0 here)
+                    bucket_units[bucket] += units if 'units' in course else 0
+                    
+                    if not course_id:
+                        continue
+                    
+                    # Required major/support courses
+                    if 'GE' not in course_id:
+                        for category_filter in required_filters:
+                            required_courses[category_filter][course_id] = None
+                    
+                    if prereqs:
+                        prerequisites[course_id] = prereqs
+                    
+                    # Categorize by level
+                    level_match = _FIRST_DIGIT(course_id)
+                    if level_match:
+                        level_courses = courses_by_level.get(level_match.group() + '00')
+                        if level_courses is not None:
+                            level_courses.append(course_id)
+                
+                period_label = period_data.get('period')
+                if period_label is None:
+                    period_label = f"{period_key.title()} {year_key.replace('_', ' ').title()}"
                 
-                optimized[year_key][period_key] = {
-                    'quarter_name' if period_data.get('period', '').find('Quarter') != -1 else 'semester_name': 
-                        period_data.get('period', f"{period_key.title()} {year_key.replace('_', ' ').title()}"),
-                    'total_units': int(period_data.get('total_units', 0)),
+                optimized_year[period_key] = {
+                    period_name_key: period_label,
+                    'total_units': period_units,
                     'courses': optimized_courses
                 }
         
-        return optimized
-    
-    def _standardize_category(self, category: str) -> str:
-        """Standardize course categories"""
-        category_map = {
-            'major': 'major_core',
-            'support': 'major_support', 
-            'ge': 'general_education',
-            'elective': 'elective',
-            'foundational': 'foundational'
-        }
-        return category_map.get(category.lower(), category)
-    
-    def _calculate_total_units(self, flowchart_data: Dict[str, Any]) -> int:
-        """Calculate total units in the degree plan"""
-        total = 0
-        for year_data in flowchart_data.values():
-            if isinstance(year_data, dict):
-                for period_data in year_data.values():
-                    if isinstance(period_data, dict):
-                        total += int(period_data.get('total_units', 0))
-        return total
-    
-    def _create_summary(self, flowchart_data: Dict[str, Any], total_units: int) -> Dict[str, Any]:
-        """Create degree plan summary"""
-        major_units = 0
-        support_units = 0
-        ge_units = 0
-        years = len([k for k in flowchart_data.keys() if k.startswith('year_')])
-        periods_per_year = 0
-        
-        # Count units by category and periods
-        for year_data in flowchart_data.values():
-            if isinstance(year_data, dict):
-                year_periods = len(year_data)
-                periods_per_year = max(periods_per_year, year_periods)
-                
-                for period_data in year_data.values():
-                    if isinstance(period_data, dict):
-                        courses = period_data.get('courses', [])
-                        for course in courses:
-                            if isinstance(course, dict):
-                                units = int(course.get('units', 0))
-                                category = course.get('category', '')
-                                
-                                if 'major' in category.lower():
-                                    major_units += units
-                                elif 'support' in category.lower():
-                                    support_units += units
-                                elif 'ge' in category.lower() or 'general' in category.lower():
-                                    ge_units += units
-        
-        return {
-            'total_major_units': major_units,
-            'total_support_units': support_units, 
-            'total_ge_units': ge_units,
+        years = sum(1 for key in flowchart_data if key.startswith('year_'))
+        summary = {
+            'total_major_units': bucket_units['major'],
+            'total_support_units': bucket_units['support'], 
+            'total_ge_units': bucket_units['ge'],
             'years': years,
             'periods_per_year': periods_per_year,
             'average_units_per_period': round(total_units / (years * periods_per_year)) if years > 0 and periods_per_year > 0 else 15
         }
+        
+        return FlowchartDigest(
+            degree_plan=degree_plan,
+            total_units=total_units,
+            summary=summary,
+            required_courses={category: list(course_ids) for category, course_ids in required_courses.items()},
+            prerequisites=prerequisites,
+            courses_by_level=courses_by_level
+        )
     
-    def _extract_requirements(self, flowchart: CourseFlowchart, university_key: str) -> Dict[str, Any]:
+    def _extract_requirements(self, digest: FlowchartDigest, university_key: str) -> Dict[str, Any]:
         """Extract degree requirements structure"""
         # This is university-specific logic that could be enhanced
         config = self.university_configs.get(university_key)
@@ -1465,7 +1675,7 @@ class UniversalFlowchartScraper:
         requirements = {
             'major_core': {
                 'total_units_required': 72,  # Default, could be calculated
-                'required_courses': self._extract_required_courses(flowchart.flowchart, 'major'),
+                'required_courses': digest.required_courses['major'],
                 'elective_units': 20,
                 'elective_options': {
                     'description': 'Upper division major electives',
@@ -1474,105 +1684,33 @@ class UniversalFlowchartScraper:
             },
             'major_support': {
                 'total_units_required': 36,  # Default, could be calculated
-                'required_courses': self._extract_required_courses(flowchart.flowchart, 'support'),
+                'required_courses': digest.required_courses['support'],
                 'additional_requirements': []
             },
             'general_education': {
                 'total_units_required': 72,  # Default, could be calculated
-                'areas': self._get_ge_areas(university_key)
+                'areas': _get_ge_areas(university_key)
             }
         }
         
         return requirements
     
-    def _extract_required_courses(self, flowchart_data: Dict[str, Any], category_filter: str) -> List[str]:
-        """Extract required courses for a specific category"""
-        required_courses = []
-        
-        for year_data in flowchart_data.values():
-            if isinstance(year_data, dict):
-                for period_data in year_data.values():
-                    if isinstance(period_data, dict):
-                        courses = period_data.get('courses', [])
-                        for course in courses:
-                            if isinstance(course, dict):
-                                category = course.get('category', '')
-                                course_id = course.get('course_id', '')
-                                
-                                if category_filter in category.lower() and course_id and 'GE' not in course_id:
-                                    required_courses.append(course_id)
-        
-        return list(set(required_courses))  # Remove duplicates
-    
-    def _get_ge_areas(self, university_key: str) -> Dict[str, Dict[str, Any]]:
-        """Get GE areas for specific university"""
-        # University-specific GE requirements
-        if university_key == 'cal_poly':
-            return {
-                'A': {'name': 'English Language Communication', 'units': 12},
-                'B': {'name': 'Scientific Inquiry', 'units': 12},
-                'C': {'name': 'Arts and Humanities', 'units': 16},
-                'D': {'name': 'Social Sciences', 'units': 16},
-                'E': {'name': 'Lifelong Learning', 'units': 4},
-                'F': {'name': 'Ethnic Studies', 'units': 4}
-            }
-        elif university_key == 'uc_berkeley':
-            return {
-                'AC': {'name': 'American Cultures', 'units': 4},
-                'QR': {'name': 'Quantitative Reasoning', 'units': 4},
-                'RC': {'name': 'Reading and Composition', 'units': 8},
-                'FL': {'name': 'Foreign Language', 'units': 0}  # May be satisfied by other means
-            }
-        else:
-            # Generic GE structure
-            return {
-                'humanities': {'name': 'Humanities', 'units': 12},
-                'social_science': {'name': 'Social Sciences', 'units': 12},
-                'natural_science': {'name': 'Natural Sciences', 'units': 12},
-                'mathematics': {'name': 'Mathematics', 'units': 8}
-            }
-    
-    def _extract_progression_rules(self, flowchart: CourseFlowchart, university_key: str) -> Dict[str, Any]:
+    def _extract_progression_rules(self, digest: FlowchartDigest) -> Dict[str, Any]:
         """Extract progression rules and prerequisites"""
-        # Build prerequisite map from flowchart data
-        prerequisites = {}
-        courses_by_level = {'100': [], '200': [], '300': [], '400': []}
-        
-        for year_data in flowchart.flowchart.values():
-            if isinstance(year_data, dict):
-                for period_data in year_data.values():
-                    if isinstance(period_data, dict):
-                        courses = period_data.get('courses', [])
-                        for course in courses:
-                            if isinstance(course, dict):
-                                course_id = course.get('course_id', '')
-                                prereqs = course.get('prerequisites', [])
-                                
-                                if course_id and prereqs:
-                                    prerequisites[course_id] = prereqs
-                                
-                                # Categorize by level
-                                if course_id:
-                                    level_match = re.search(r'(\d)', course_id)
-                                    if level_match:
-                                        level = level_match.group(1) + '00'
-                                        if level in courses_by_level:
-                                            courses_by_level[level].append(course_id)
-        
         return {
-            'prerequisites': prerequisites,
+            'prerequisites': digest.prerequisites,
             'unit_minimums': {
                 'sophomore_standing': 45,
                 'junior_standing': 90, 
                 'senior_standing': 135,
-                'graduation': self._calculate_total_units(flowchart.flowchart)
+                'graduation': digest.total_units
             },
             'gpa_requirements': {
-                'major_gpa': 2.0,
-                'overall_gpa': 2.0,
-                'graduation_gpa': 2.0
+                'major_gpa': MINIMUM_GPA,
+                'overall_gpa': MINIMUM_GPA,
+                'graduation_gpa': MINIMUM_GPA
             },
-            'courses_by_level': courses_by_level
+            'courses_by_level': digest.courses_by_level
         }
     
     def _optimize_tracks(self, tracks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -1592,41 +1730,15 @@ class UniversalFlowchartScraper:
         
         return optimized_tracks
     
-    def _create_milestones(self, academic_system: str) -> Dict[str, str]:
-        """Create academic milestones based on system"""
-        if academic_system == 'quarter':
-            return {
-                'freshman_year': 'Complete foundational courses and adjust to university life',
-                'sophomore_year': 'Complete core major requirements and explore concentrations',
-                'junior_year': 'Complete advanced major courses and begin specialization',
-                'senior_year': 'Complete capstone projects and prepare for career/graduate school'
-            }
-        else:  # semester
-            return {
-                'freshman_year': 'Complete foundational courses and general education requirements',
-                'sophomore_year': 'Declare major and complete prerequisite courses',
-                'junior_year': 'Complete major core requirements and begin advanced coursework',
-                'senior_year': 'Complete capstone requirements and finalize degree'
-            }
-    
-    def _convert_floats_to_decimals(self, obj):
-        """Recursively convert float values to Decimal for DynamoDB compatibility"""
-        if isinstance(obj, float):
-            return Decimal(str(obj))
-        elif isinstance(obj, dict):
-            return {key: self._convert_floats_to_decimals(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_floats_to_decimals(item) for item in obj]
-        else:
-            return obj
-    
     def test_connections(self) -> bool:
         """Test internet and DynamoDB connections"""
         logger.info("Testing connections...")
         
-        # Test internet connection
+        # Test internet connection (never answered from the response cache)
+        no_cache = self.session.cache_disabled() if REQUESTS_CACHE_SUPPORT else contextlib.nullcontext()
         try:
-            response = self.session.get('https://www.google.com', timeout=10)
+            with no_cache:
+                response = self.session.get('https://www.google.com', timeout=10)
             response.raise_for_status()
             logger.info("✅ Internet connection successful")
         except Exception as e:
@@ -1644,43 +1756,49 @@ class UniversalFlowchartScraper:
     
     def print_summary(self, results: Dict) -> None:
         """Print summary of scraping results"""
-        print(f"\n{'='*60}")
-        print("📊 FLOWCHART SCRAPING COMPLETE")
-        print(f"{'='*60}")
-        print(f"🏫 University: {results['university']}")
-        print(f"📊 Total Majors Attempted: {results['total_majors']}")
-        print(f"✅ Successful Majors: {', '.join(results['successful_majors']) if results['successful_majors'] else 'None'}")
-        print(f"❌ Failed Majors: {', '.join(results['failed_majors']) if results['failed_majors'] else 'None'}")
-        print(f"💾 Flowcharts Saved: {results['save_success']}")
-        print(f"⚠️  Save Errors: {results['save_errors']}")
+        # Built up and printed in one call so summaries from concurrent scrapes don't interleave
+        lines = [
+            f"\n{'='*60}",
+            "📊 FLOWCHART SCRAPING COMPLETE",
+            f"{'='*60}",
+            f"🏫 University: {results['university']}",
+            f"📊 Total Majors Attempted: {results['total_majors']}",
+            f"✅ Successful Majors: {', '.join(results['successful_majors']) if results['successful_majors'] else 'None'}",
+            f"❌ Failed Majors: {', '.join(results['failed_majors']) if results['failed_majors'] else 'None'}",
+            f"💾 Flowcharts Saved: {results['save_success']}",
+            f"⚠️  Save Errors: {results['save_errors']}"
+        ]
         
         if results['save_success'] > 0:
-            print(f"\n🎉 SUCCESS! Your database now has flowcharts for {results['save_success']} majors!")
-            print("🚀 Your AI advisor can now provide semester-by-semester planning!")
+            lines.append(f"\n🎉 SUCCESS! Your database now has flowcharts for {results['save_success']} majors!")
+            lines.append("🚀 Your AI advisor can now provide semester-by-semester planning!")
         else:
-            print("\n😞 No flowcharts were saved. Check the logs for details.")
+            lines.append("\n😞 No flowcharts were saved. Check the logs for details.")
         
-        print(f"{'='*60}")
+        lines.append(f"{'='*60}")
+        print("\n".join(lines))
     
     def _print_batch_summary(self, summary: Dict, all_results: Dict) -> None:
         """Print summary of batch scraping results"""
-        print(f"\n{'='*80}")
-        print("🌍 BATCH FLOWCHART SCRAPING COMPLETE")
-        print(f"{'='*80}")
-        print(f"🏫 Universities Attempted: {summary['universities_attempted']}")
-        print(f"✅ Universities Successful: {summary['universities_successful']}")
-        print(f"📊 Total Flowcharts Attempted: {summary['total_flowcharts']}")
-        print(f"💾 Total Flowcharts Saved: {summary['total_save_success']}")
-        print(f"⚠️  Total Save Errors: {summary['total_save_errors']}")
-        
-        print("\n📋 Per-University Results:")
+        lines = [
+            f"\n{'='*80}",
+            "🌍 BATCH FLOWCHART SCRAPING COMPLETE",
+            f"{'='*80}",
+            f"🏫 Universities Attempted: {summary['universities_attempted']}",
+            f"✅ Universities Successful: {summary['universities_successful']}",
+            f"📊 Total Flowcharts Attempted: {summary['total_flowcharts']}",
+            f"💾 Total Flowcharts Saved: {summary['total_save_success']}",
+            f"⚠️  Total Save Errors: {summary['total_save_errors']}",
+            "\n📋 Per-University Results:"
+        ]
         for uni_key, results in all_results.items():
             if "error" in results:
-                print(f"  ❌ {uni_key}: {results['error']}")
+                lines.append(f"  ❌ {uni_key}: {results['error']}")
             else:
-                print(f"  ✅ {uni_key}: {results['save_success']}/{results['total_majors']} flowcharts saved")
+                lines.append(f"  ✅ {uni_key}: {results['save_success']}/{results['total_majors']} flowcharts saved")
         
-        print(f"{'='*80}")
+        lines.append(f"{'='*80}")
+        print("\n".join(lines))
 
 def main():
     """Main function with enhanced options"""
@@ -1813,6 +1931,8 @@ def main():
         logger.error(f"Scraping failed: {e}")
         print(f"❌ Scraping failed: {e}")
         return 1
+    finally:
+        shutdown_pdf_pool()
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file
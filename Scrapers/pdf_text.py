@@ -0,0 +1,49 @@
+"""
+PDF text extraction for the flowchart scraper
+Kept free of side effects (no logging setup, AWS or HTTP imports) so worker
+processes that extract text only import the PDF libraries they need
+"""
+
+import io
+
+# Try to import PDF processing libraries (optional for non-PDF sources)
+# PyMuPDF is by far the fastest text extractor, so it is preferred when installed
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_SUPPORT = True
+except ImportError:
+    PYMUPDF_SUPPORT = False
+
+try:
+    import PyPDF2
+    PDF_SUPPORT = True
+except ImportError:
+    PDF_SUPPORT = False
+
+try:
+    import pdfplumber
+    PDFPLUMBER_SUPPORT = True
+except ImportError:
+    PDFPLUMBER_SUPPORT = False
+
+def extract_pdf_text(content: bytes) -> str:
+    """Extract PDF text with the fastest installed library"""
+    if PYMUPDF_SUPPORT:
+        with fitz.open(stream=content, filetype="pdf") as doc:
+            return "".join(page.get_text("text") + "\n" for page in doc)
+
+    if PDFPLUMBER_SUPPORT:
+        with pdfplumber.open(io.BytesIO(content)) as pdf:
+            page_texts = []
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                # Drop cached chars/rects/curves so only one page's layout is held at a time
+                page.flush_cache()
+                if page_text:
+                    page_texts.append(page_text)
+
+        # One join instead of re-copying the growing string for every page
+        return "".join(page_text + "\n" for page_text in page_texts)
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+    return "".join(page.extract_text() + "\n" for page in pdf_reader.pages)
@@ -20,6 +20,14 @@ const COURSE_CATALOG_TABLE = process.env.COURSE_CATALOG_TABLE || 'college-hq-cou
 const DEGREE_REQUIREMENTS_TABLE = process.env.DEGREE_REQUIREMENTS_TABLE || 'college-hq-degree-requirements';
 const COURSE_FLOWCHART_TABLE = process.env.COURSE_FLOWCHART_TABLE || 'college-hq-course-flowchart';
 
+// Response headers are the same for every request, so build them once per container
+const RESPONSE_HEADERS = Object.freeze({
+  'Content-Type': 'application/json',
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+  'Access-Control-Allow-Methods': 'POST,OPTIONS'
+});
+
 // ====================================
 // MAIN LAMBDA HANDLER
 // ====================================
@@ -825,12 +833,7 @@ function generateConversationId() {
 function createResponse(statusCode, body) {
   return {
     statusCode,
-    headers: {
-      'Content-Type': 'application/json',
-      'Access-Control-Allow-Origin': '*',
-      'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-      'Access-Control-Allow-Methods': 'POST,OPTIONS'
-    },
+    headers: RESPONSE_HEADERS,
     body: JSON.stringify(body)
   };
 }
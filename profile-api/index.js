@@ -17,6 +17,14 @@ const dynamodb = new AWS.DynamoDB.DocumentClient();
 // DynamoDB table names
 const USERS_TABLE = process.env.USERS_TABLE || 'college-hq-users';
 
+// Response headers are the same for every request, so build them once per container
+const RESPONSE_HEADERS = Object.freeze({
+  'Content-Type': 'application/json',
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
+  'Access-Control-Allow-Methods': 'GET,PUT,POST,DELETE,OPTIONS'
+});
+
 // ====================================
 // MAIN LAMBDA HANDLER
 // ====================================
@@ -197,12 +205,7 @@ function createDefaultProfile(userId) {
 function createResponse(statusCode, body) {
   return {
     statusCode,
-    headers: {
-      'Content-Type': 'application/json',
-      'Access-Control-Allow-Origin': '*',
-      'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token',
-      'Access-Control-Allow-Methods': 'GET,PUT,POST,DELETE,OPTIONS'
-    },
+    headers: RESPONSE_HEADERS,
     body: JSON.stringify(body)
   };
 };